@@ -10,17 +10,6 @@ from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
 from pypdf import PdfReader
-from langchain_openai import ChatOpenAI
-
-try:
-    from langchain_anthropic import ChatAnthropic
-except ImportError:  # optional
-    ChatAnthropic = None
-
-try:
-    from langchain_groq import ChatGroq
-except ImportError:  # optional
-    ChatGroq = None
 
 from ...core.config import get_config
 from ...core.state import AgentState, Evidence
@@ -142,8 +131,13 @@ class VisionInspector:
     def _build_vision_llm(self) -> Tuple[Optional[object], Optional[str]]:
         """
         Select a vision-capable LLM based on available API keys (in priority order).
+
+        Provider packages are imported only in the branch that uses them, so
+        building the graph never pays for clients the run does not select.
         """
         if self.config.openai_api_key:
+            from langchain_openai import ChatOpenAI
+
             return (
                 ChatOpenAI(
                     model=self.config.default_vision_model,
@@ -153,27 +147,37 @@ class VisionInspector:
                 "openai",
             )
 
-        if self.config.anthropic_api_key and ChatAnthropic:
-            return (
-                ChatAnthropic(
-                    model="claude-3-5-sonnet-latest",
-                    temperature=0.1,
-                    max_tokens=256,
-                ),
-                "anthropic",
-            )
+        if self.config.anthropic_api_key:
+            try:
+                from langchain_anthropic import ChatAnthropic
+            except ImportError:  # optional
+                pass
+            else:
+                return (
+                    ChatAnthropic(
+                        model="claude-3-5-sonnet-latest",
+                        temperature=0.1,
+                        max_tokens=256,
+                    ),
+                    "anthropic",
+                )
 
-        if self.config.groq_api_key and ChatGroq:
-            model_name = self.config.default_vision_model
-            return (
-                ChatGroq(
-                    model=model_name,
-                    temperature=0.1,
-                    max_tokens=256,
-                    api_key=self.config.groq_api_key,
-                ),
-                "groq",
-            )
+        if self.config.groq_api_key:
+            try:
+                from langchain_groq import ChatGroq
+            except ImportError:  # optional
+                pass
+            else:
+                model_name = self.config.default_vision_model
+                return (
+                    ChatGroq(
+                        model=model_name,
+                        temperature=0.1,
+                        max_tokens=256,
+                        api_key=self.config.groq_api_key,
+                    ),
+                    "groq",
+                )
 
         # HuggingFace multimodal could be added here once supported.
         return None, None
@@ -3,36 +3,310 @@ Base Judge class with common functionality for all judge personas.
 """
 
 from abc import ABC, abstractmethod
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import functools
+import heapq
 import json
 import random
 import re
+import sys
 import time
-from typing import Dict, List, Literal, Optional
+from typing import Any, Callable, Dict, List, Literal, Optional, Union
 
 from langchain_core.messages import SystemMessage
 try:
-    from langchain_core.output_parsers import OutputParserException
+    from langchain_core.exceptions import OutputParserException
 except ImportError:  # fallback for older langchain-core
     OutputParserException = Exception  # type: ignore
-from langchain_openai import ChatOpenAI
-from pydantic import BaseModel, Field, ValidationError
+from pydantic import BaseModel, Field, PrivateAttr, ValidationError
 
 try:
-    from langchain_anthropic import ChatAnthropic
-except ImportError:  # pragma: no cover - optional provider dependency
-    ChatAnthropic = None
+    import ahocorasick
+except ImportError:  # pragma: no cover - optional speedup dependency
+    ahocorasick = None
 
+# The third-party regex engine searches the wide alternations below noticeably
+# faster than re; tokenizing and splitting stay on re, which is faster there.
 try:
-    from langchain_groq import ChatGroq
-except ImportError:  # pragma: no cover - optional provider dependency
-    ChatGroq = None
+    import regex as alternation_re
+except ImportError:  # pragma: no cover - optional speedup dependency
+    alternation_re = re
 
 from ...core.config import get_config
 from ...core.state import Evidence, JudicialOpinion
 from ...utils.logger import get_logger
 
+_json_loads: Callable[[Union[str, bytes]], Any]
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # pragma: no cover - optional speedup dependency
+    _json_loads = json.loads
+
 logger = get_logger()
 
+# Every high-risk claim pattern needs a digit or a word starting with one of the
+# keyword initials (always/all, never/none/no evidence, purely, only).
+# Patterns below run on lowercased text, so they avoid re.IGNORECASE.
+_HIGH_RISK_CANDIDATE_RE = re.compile(r"\d|\b[anpo]")
+# One alternation so each sentence is scanned once, not once per pattern.
+_HIGH_RISK_RE = alternation_re.compile(
+    r"\b\d{1,3}%\b"
+    r"|\b\d+\s*(?:times|x)\b"
+    r"|\b(?:always|never|purely|only|all|none|no evidence)\b"
+)
+# Shared by evidence-token collection and sentence anchoring; compiled at import
+# so the first grounding pass does not pay the compile cost.
+_TOKEN_RE = re.compile(r"[A-Za-z][A-Za-z0-9_./-]{3,}")
+# Grounding: path-like references, sentence boundaries, and claims that
+# contradict strong evidence (checked against normalized sentences).
+# The path body is possessive so a long run of separators in model output never
+# backtracks; _redact_unverified_paths trims the trailing separators that the
+# old `[\w./-]+\b` form gave back, leaving the reference to end on a word char.
+_PATH_RE = alternation_re.compile(
+    r"\b(?:src|lib|app|tools|agents)/[\w./-]*+", alternation_re.IGNORECASE
+)
+_SENTENCE_SPLIT_RE = re.compile(r"(?<=[.!?])\s+")
+# Phrases in the flattened evidence text that prove a capability exists, and
+# so make claims of its absence contradictions.
+_SANDBOX_SIGNAL_TERMS = frozenset(
+    {
+        "sandboxed_git_clone",
+        "repositorysandbox.clone_repository",
+        "src/tools/git_tools.py",
+        "without raw os.system",
+    }
+)
+_PARALLEL_SIGNAL_TERMS = frozenset(
+    {
+        "parallel detective fan-out",
+        "parallel judge fan-out",
+        "stategraph found with parallel architecture",
+        "src/core/graph.py",
+    }
+)
+# All three persona taglines together also prove distinct prompts.
+_PERSONA_PHRASE_TERMS = frozenset(
+    {"trust no one", "reward effort", "does it actually work"}
+)
+_EVIDENCE_SIGNAL_TERMS = (
+    _SANDBOX_SIGNAL_TERMS
+    | _PARALLEL_SIGNAL_TERMS
+    | _PERSONA_PHRASE_TERMS
+    | {"distinct judge prompts detected"}
+)
+# Legacy path mentions accepted for their current locations.
+_LEGACY_PATH_ALIASES = {
+    "src/state.py": "src/core/state.py",
+    "src/graph.py": "src/core/graph.py",
+}
+_SANDBOX_CONTRADICTION_SOURCES = (
+    r"\bfail\w*\s+to\s+implement\s+sandbox(?:ed)?\s+git\b",
+    r"\bno mention of sandbox",
+    r"\blacks?\b.*\bsandbox",
+    r"\babsence of explicit sandbox",
+    r"\bno explicit sandbox",
+    r"\bwithout\b.*\bsandbox(?:ing|ed)?\b",
+)
+_PARALLEL_CONTRADICTION_SOURCES = (
+    r"\blinear graph\b",
+    r"\bno parallel\w*\b",
+    r"\bno code implements\b.*\b(?:parallel|fan-out|fan-in)\b",
+    r"\bno proof of\b.*\bparallel(?:ism| judges| execution)?\b",
+    r"\bparallel(?:ism| judges)?\b.*\bremains unverified\b",
+)
+_PERSONA_CONTRADICTION_SOURCES = (
+    r"\bshared\s+\d{1,3}%\s+identical prompt\b",
+    r"\bpersona collusion\b",
+    r"\black of distinct judicial logic\b",
+)
+# Replaces an argument once every sentence in it has been pruned.
+_NO_VERIFIED_CLAIMS_TEXT = "Opinion retained only where verifiable evidence exists."
+# Defaults for keys a coerced provider payload leaves out; the argument is
+# pre-padded to the 100-character minimum.
+_DEFAULT_OPINION_FIELDS = {
+    "score": 3,
+    "argument": (
+        "Fallback opinion with padding to satisfy minimum length. "
+        "pad.pad.pad.pad.pad.pad.pad.pad.pad.pad.pad.pad"
+    ),
+}
+# Filler sliced by _pad_argument; longer than the 100-character argument minimum.
+_PAD_SOURCE = "pad." * 32
+# Appended to the prompt whenever a judge falls back to plain JSON text mode.
+_JSON_FALLBACK_TEMPLATE = (
+    "Return ONLY valid JSON with keys: "
+    "criterion_id (string), score (integer 1-5), "
+    "argument (string min 100 chars), cited_evidence (array of strings). "
+    "Use criterion_id='{criterion_id}'."
+)
+
+# Provider error classification: exception types first, message markers as fallback.
+_TOOL_USE_FAILURE_RE = re.compile(
+    "|".join(
+        re.escape(marker)
+        for marker in ("tool_use_failed", "Failed to call a function", "function_calling")
+    )
+)
+_RATE_LIMIT_RE = re.compile(
+    "|".join(
+        re.escape(marker)
+        for marker in (
+            "429",
+            "rate_limit_exceeded",
+            "Rate limit reached",
+            "tokens per minute",
+            "insufficient_quota",
+        )
+    )
+)
+# Matched against the lowercased message.
+_INSUFFICIENT_QUOTA_RE = re.compile(
+    "|".join(
+        re.escape(marker)
+        for marker in (
+            "quota",
+            "402",
+            "depleted your monthly included credits",
+            "payment required",
+        )
+    )
+)
+
+# Detectives whose evidence is relevant to each rubric target artifact.
+_ALLOWED_DETECTIVES_BY_ARTIFACT = {
+    "github_repo": frozenset({"RepoInvestigator"}),
+    # Allow RepoInvestigator when evaluating docs so judges can cross-check PDF claims against code
+    "pdf_report": frozenset(
+        {"DocAnalyst", "VisionInspector", "CrossReference", "RepoInvestigator"}
+    ),
+}
+# Evidence mentioning these get a ranking bonus when context space is tight.
+_PRIORITY_TERMS = (
+    "src/core/state.py",
+    "src/core/graph.py",
+    "src/tools/git_tools.py",
+    "src/agents/judges/base_judge.py",
+    "src/agents/judges/prosecutor.py",
+    "src/agents/judges/defense.py",
+    "src/agents/judges/tech_lead.py",
+    "pydantic models",
+    "parallel detective fan-out",
+    "distinct judge prompts",
+    "structuredopinion",
+    "response coercion",
+)
+if ahocorasick is not None:
+    _PRIORITY_AUTOMATON = ahocorasick.Automaton()
+    for _term in _PRIORITY_TERMS:
+        _PRIORITY_AUTOMATON.add_word(_term, _term)
+    _PRIORITY_AUTOMATON.make_automaton()
+else:
+    _PRIORITY_AUTOMATON = None
+    _PRIORITY_RE = re.compile("|".join(re.escape(term) for term in _PRIORITY_TERMS))
+
+if ahocorasick is not None:
+    _EVIDENCE_SIGNAL_AUTOMATON = ahocorasick.Automaton()
+    for _term in _EVIDENCE_SIGNAL_TERMS:
+        _EVIDENCE_SIGNAL_AUTOMATON.add_word(_term, _term)
+    _EVIDENCE_SIGNAL_AUTOMATON.make_automaton()
+else:
+    _EVIDENCE_SIGNAL_AUTOMATON = None
+
+
+def _find_priority_terms(text: str) -> set[str]:
+    """Return the distinct priority terms occurring in text, in one scan."""
+    if _PRIORITY_AUTOMATON is not None:
+        return {term for _, term in _PRIORITY_AUTOMATON.iter(text)}
+    return set(_PRIORITY_RE.findall(text))
+
+
+@functools.lru_cache(maxsize=4096)
+def _normalize_location(value: str) -> str:
+    """Normalize a location string for fuzzy evidence matching."""
+    return str(value or "").strip().lower().replace("\\", "/")
+
+
+@functools.lru_cache(maxsize=32)
+def _supported_legacy_paths(allowed_locations: frozenset[str]) -> frozenset[str]:
+    """Return the legacy path aliases whose current location is in allowed_locations."""
+    return frozenset(
+        legacy
+        for legacy, current in _LEGACY_PATH_ALIASES.items()
+        if any(current in location for location in allowed_locations)
+    )
+
+
+_REQUIRED = object()
+
+
+def _criterion_field(criterion, key: str, default=_REQUIRED):
+    """
+    Read one field from a rubric criterion given as a dict or RubricDimension.
+
+    Avoids model_dump() copying every field when only a few are read. Without a
+    default, a missing key raises like a plain subscript would.
+    """
+    if isinstance(criterion, dict):
+        if default is _REQUIRED:
+            return criterion[key]
+        return criterion.get(key, default)
+    if default is _REQUIRED:
+        return getattr(criterion, key)
+    return getattr(criterion, key, default)
+
+
+@functools.lru_cache(maxsize=8)
+def _contradiction_re(
+    sandbox: bool, parallel: bool, persona: bool
+) -> Optional[alternation_re.Pattern]:
+    """
+    Return one alternation over the contradiction patterns for the active
+    evidence categories, or None when no category is active.
+    """
+    sources = (
+        (_SANDBOX_CONTRADICTION_SOURCES if sandbox else ())
+        + (_PARALLEL_CONTRADICTION_SOURCES if parallel else ())
+        + (_PERSONA_CONTRADICTION_SOURCES if persona else ())
+    )
+    if not sources:
+        return None
+    return alternation_re.compile("|".join(sources), alternation_re.IGNORECASE)
+
+
+def _json_prompt(messages: List, criterion_id: str) -> List:
+    """Return messages followed by the JSON-only answer instruction."""
+    return messages + [
+        {
+            "role": "user",
+            "content": _JSON_FALLBACK_TEMPLATE.format(criterion_id=criterion_id),
+        }
+    ]
+
+
+def _rate_limit_error_types() -> tuple[type, ...]:
+    """
+    Return RateLimitError classes from provider SDKs that are already imported.
+
+    An SDK that was never imported cannot have raised, so this avoids loading
+    providers the run does not use.
+    """
+    error_types = []
+    for module_name in ("openai", "anthropic", "groq"):
+        error_type = getattr(sys.modules.get(module_name), "RateLimitError", None)
+        if isinstance(error_type, type):
+            error_types.append(error_type)
+    return tuple(error_types)
+
+
+# Artifact each detective reports on, used when formatting judge context.
+_DETECTIVE_TARGETS = {
+    "RepoInvestigator": "github_repo",
+    "DocAnalyst": "pdf_report",
+    "VisionInspector": "pdf_report",
+    "CrossReference": "pdf_report",
+}
+
 
 class StructuredOpinion(BaseModel):
     """Structured output schema for judicial opinions."""
@@ -46,6 +320,18 @@ class StructuredOpinion(BaseModel):
     cited_evidence: List[str] = Field(
         description="Specific evidence references that support this opinion"
     )
+    # Set when a fallback path produced this opinion instead of a normal answer.
+    _fallback: bool = PrivateAttr(default=False)
+
+
+def _mark_fallback(opinion: StructuredOpinion) -> StructuredOpinion:
+    """Flag an opinion produced by a fallback path (quota, retry, malformed, offline)."""
+    opinion._fallback = True
+    return opinion
+
+
+class _ContextBudgetExceeded(Exception):
+    """Raised internally once judge evidence context exceeds its character budget."""
 
 
 class OfflineJudgeLLM:
@@ -57,16 +343,21 @@ class OfflineJudgeLLM:
         return self
 
     def invoke(self, _messages):
-        return StructuredOpinion(
-            criterion_id="offline_fallback",
-            score=3,
-            argument=(
-                "No LLM API key configured. Returning a deterministic neutral opinion "
-                "to keep non-network workflows executable."
-            ),
-            cited_evidence=["offline_fallback"],
+        return _mark_fallback(
+            StructuredOpinion.model_construct(
+                criterion_id="offline_fallback",
+                score=3,
+                argument=(
+                    "No LLM API key configured. Returning a deterministic neutral "
+                    "opinion to keep non-network workflows executable."
+                ),
+                cited_evidence=["offline_fallback"],
+            )
         )
 
+    async def ainvoke(self, messages):
+        return self.invoke(messages)
+
 
 class BaseJudge(ABC):
     """
@@ -74,6 +365,26 @@ class BaseJudge(ABC):
     Enforces structured output and provides common utilities.
     """
 
+    # Criterion-independent end of the user prompt; {judge} is filled once per
+    # instance in __init__.
+    _USER_PROMPT_TAIL = """
+
+**YOUR TASK:**
+As the {judge}, evaluate this criterion based on the evidence.
+You must return a score (1-5) with detailed reasoning that cites specific evidence.
+Do not claim a feature is missing if FOUND evidence already confirms it.
+If evidence is mixed, state uncertainty instead of absolute absence.
+
+Score 1: Critical failure / Security violation / Missing entirely
+Score 2: Major gaps / Significant issues
+Score 3: Functional but flawed / Technical debt present
+Score 4: Good implementation / Minor issues only
+Score 5: Excellent / Exceeds expectations
+
+Your argument must be at least 100 characters and cite specific evidence.
+Keep your argument concise (target 100-220 characters).
+        """
+
     def __init__(self, judge_name: Literal["Prosecutor", "Defense", "TechLead"]):
         """
         Initialize base judge.
@@ -83,6 +394,23 @@ class BaseJudge(ABC):
         """
         self.judge_name = judge_name
         self.config = get_config(require_llm_keys=False)
+        self._system_prompt_cache: Optional[str] = None
+        # Evidence-derived grounding inputs keyed by id(evidences), kept only for
+        # the duration of one render_opinions batch; see _grounding_inputs.
+        self._grounding_cache: Optional[
+            Dict[
+                int,
+                tuple[
+                    Dict[str, List[Evidence]],
+                    frozenset[str],
+                    frozenset[str],
+                    frozenset[str],
+                ],
+            ]
+        ] = None
+        # Private generator for retry jitter, independent of the module-level random state.
+        self._retry_rng = random.Random()
+        self._user_prompt_tail = self._USER_PROMPT_TAIL.replace("{judge}", judge_name)
         self.force_json_mode = bool(
             self.config.huggingface_api_key
             and not self.config.openai_api_key
@@ -120,10 +448,17 @@ class BaseJudge(ABC):
         """
         pass
 
+    def system_prompt(self) -> str:
+        """Return this judge's system prompt, building it once per instance."""
+        if self._system_prompt_cache is None:
+            self._system_prompt_cache = self.get_system_prompt()
+        return self._system_prompt_cache
+
     def render_opinion(
         self,
         criterion: Dict,
         evidences: Dict[str, List[Evidence]],
+        evidence_context: Optional[str] = None,
     ) -> JudicialOpinion:
         """
         Render a judicial opinion for a specific criterion.
@@ -131,106 +466,235 @@ class BaseJudge(ABC):
         Args:
             criterion: The rubric criterion to evaluate
             evidences: All evidence collected by detectives
+            evidence_context: Formatted evidence from prepare_context, shared
+                across judges evaluating the same criterion
 
         Returns:
             JudicialOpinion object
         """
-        criterion_data = (
-            criterion.model_dump() if hasattr(criterion, "model_dump") else criterion
+        criterion_id, messages = self._build_messages(
+            criterion, evidences, evidence_context
         )
-        criterion_id = criterion_data["id"]
-        logger.info(f"{self.judge_name} evaluating criterion: {criterion_id}")
 
-        # Build evidence context
-        filtered_evidence = self._filter_evidence_by_target(
-            evidences, criterion_data.get("target_artifact")
-        )
-        evidence_context = self._format_evidence_for_context(
-            filtered_evidence, criterion_data
-        )
+        try:
+            response = self._invoke_with_fallback(messages, criterion_id)
+            return self._finalize_opinion(response, criterion_id, evidences)
 
-        # Get judicial logic for this persona
-        judicial_instruction = criterion_data["judicial_logic"].get(
-            self.judge_name.lower(), ""
+        except Exception as e:
+            return self._error_opinion(criterion_id, e)
+
+    async def arender_opinion(
+        self,
+        criterion: Dict,
+        evidences: Dict[str, List[Evidence]],
+        evidence_context: Optional[str] = None,
+    ) -> JudicialOpinion:
+        """
+        Async twin of render_opinion using non-blocking LLM calls.
+
+        Args:
+            criterion: The rubric criterion to evaluate
+            evidences: All evidence collected by detectives
+            evidence_context: Formatted evidence from prepare_context, shared
+                across judges evaluating the same criterion
+
+        Returns:
+            JudicialOpinion object
+        """
+        criterion_id, messages = self._build_messages(
+            criterion, evidences, evidence_context
         )
 
-        # Construct prompt
-        user_message = f"""
-**CRITERION TO EVALUATE:**
-{criterion_data['name']}
+        try:
+            response = await self._ainvoke_with_fallback(messages, criterion_id)
+            return self._finalize_opinion(response, criterion_id, evidences)
 
-**FORENSIC INSTRUCTION:**
-{criterion_data['forensic_instruction']}
+        except Exception as e:
+            return self._error_opinion(criterion_id, e)
 
-**YOUR JUDICIAL LOGIC ({self.judge_name}):**
-{judicial_instruction}
+    def render_opinions(
+        self,
+        criteria: List[Dict],
+        evidences: Dict[str, List[Evidence]],
+    ) -> List[JudicialOpinion]:
+        """
+        Render opinions for several criteria on a thread pool.
 
-**AVAILABLE EVIDENCE:**
-{evidence_context}
+        Each render_opinion call is dominated by the LLM round trip, so running
+        them side by side overlaps network latency. At most LLM_MAX_CONCURRENCY
+        requests are in flight, keeping bursts within provider rate limits.
 
-**YOUR TASK:**
-As the {self.judge_name}, evaluate this criterion based on the evidence.
-You must return a score (1-5) with detailed reasoning that cites specific evidence.
-Do not claim a feature is missing if FOUND evidence already confirms it.
-If evidence is mixed, state uncertainty instead of absolute absence.
+        Args:
+            criteria: Rubric criteria to evaluate
+            evidences: All evidence collected by detectives
 
-Score 1: Critical failure / Security violation / Missing entirely
-Score 2: Major gaps / Significant issues
-Score 3: Functional but flawed / Technical debt present
-Score 4: Good implementation / Minor issues only
-Score 5: Excellent / Exceeds expectations
+        Returns:
+            JudicialOpinion objects in the same order as criteria
+        """
+        criteria = list(criteria)
+        if not criteria:
+            return []
 
-Your argument must be at least 100 characters and cite specific evidence.
-Keep your argument concise (target 100-220 characters).
+        self._grounding_cache = {}
+        try:
+            with ThreadPoolExecutor(
+                max_workers=min(len(criteria), self.config.llm_max_concurrency)
+            ) as executor:
+                return list(
+                    executor.map(
+                        lambda criterion: self.render_opinion(criterion, evidences),
+                        criteria,
+                    )
+                )
+        finally:
+            self._grounding_cache = None
+
+    async def arender_opinions(
+        self,
+        criteria: List[Dict],
+        evidences: Dict[str, List[Evidence]],
+    ) -> List[JudicialOpinion]:
         """
+        Render opinions for several criteria concurrently, with at most
+        LLM_MAX_CONCURRENCY requests in flight.
 
-        # Get system prompt
-        system_prompt = self.get_system_prompt()
+        Args:
+            criteria: Rubric criteria to evaluate
+            evidences: All evidence collected by detectives
 
-        try:
-            messages = [
-                SystemMessage(content=system_prompt),
-                {"role": "user", "content": user_message},
-            ]
-            response = self._invoke_with_fallback(messages, criterion_id)
-            response = self._ground_opinion(response, criterion_id, evidences)
+        Returns:
+            JudicialOpinion objects in the same order as criteria
+        """
+        semaphore = asyncio.Semaphore(self.config.llm_max_concurrency)
 
-            # Convert to JudicialOpinion
-            opinion = JudicialOpinion(
-                judge=self.judge_name,
-                criterion_id=criterion_id,
-                score=response.score,
-                argument=response.argument,
-                cited_evidence=response.cited_evidence,
+        async def render(criterion: Dict) -> JudicialOpinion:
+            async with semaphore:
+                return await self.arender_opinion(criterion, evidences)
+
+        self._grounding_cache = {}
+        try:
+            return list(
+                await asyncio.gather(*(render(criterion) for criterion in criteria))
             )
+        finally:
+            self._grounding_cache = None
 
-            if not opinion.cited_evidence or opinion.cited_evidence == [
-                "insufficient_verified_evidence"
-            ]:
-                opinion.score = min(opinion.score, 2)
-                opinion.argument += " No verified evidence; score capped."
+    def prepare_context(
+        self,
+        criterion: Dict,
+        evidences: Dict[str, List[Evidence]],
+    ) -> tuple[str, str]:
+        """
+        Build the formatted evidence context for a criterion.
+
+        The evidence context depends only on the criterion target and the shared
+        token-budget config, so callers can build it once and pass it to every
+        judge's render_opinion.
+
+        Returns:
+            Tuple of (criterion_id, evidence_context)
+        """
+        target_artifact = _criterion_field(criterion, "target_artifact", None)
+        filtered_evidence = self._filter_evidence_by_target(evidences, target_artifact)
+        evidence_context = self._format_evidence_for_context(
+            filtered_evidence, criterion
+        )
+        return _criterion_field(criterion, "id"), evidence_context
 
-            logger.log_judicial_opinion(self.judge_name, criterion_id, opinion.score)
+    def _build_messages(
+        self,
+        criterion: Dict,
+        evidences: Dict[str, List[Evidence]],
+        evidence_context: Optional[str] = None,
+    ) -> tuple[str, List]:
+        """Build the chat messages for one criterion evaluation."""
+        criterion_id = _criterion_field(criterion, "id")
+        logger.info(f"{self.judge_name} evaluating criterion: {criterion_id}")
+        if evidence_context is None:
+            _, evidence_context = self.prepare_context(criterion, evidences)
 
-            return opinion
+        # Get judicial logic for this persona
+        judicial_instruction = _criterion_field(criterion, "judicial_logic").get(
+            self.judge_name.lower(), ""
+        )
 
-        except Exception as e:
-            logger.error(
-                f"{self.judge_name} failed to render opinion: {e}", exc_info=True
+        # Construct prompt
+        user_message = "".join(
+            (
+                "\n**CRITERION TO EVALUATE:**\n",
+                _criterion_field(criterion, "name"),
+                "\n\n**FORENSIC INSTRUCTION:**\n",
+                _criterion_field(criterion, "forensic_instruction"),
+                f"\n\n**YOUR JUDICIAL LOGIC ({self.judge_name}):**\n",
+                judicial_instruction,
+                "\n\n**AVAILABLE EVIDENCE:**\n",
+                evidence_context,
+                self._user_prompt_tail,
             )
+        )
 
-            # Return fallback opinion
-            return JudicialOpinion(
-                judge=self.judge_name,
-                criterion_id=criterion_id,
-                score=3,  # Neutral score on error
-                argument=f"Failed to evaluate due to error: {str(e)}. Defaulting to neutral score.",
-                cited_evidence=["error"],
-            )
+        # Get system prompt
+        system_prompt = self.system_prompt()
+
+        messages = [
+            SystemMessage(content=system_prompt),
+            {"role": "user", "content": user_message},
+        ]
+        return criterion_id, messages
+
+    def _finalize_opinion(
+        self,
+        response: StructuredOpinion,
+        criterion_id: str,
+        evidences: Dict[str, List[Evidence]],
+    ) -> JudicialOpinion:
+        """Ground a structured response and convert it to a JudicialOpinion."""
+        # Read before grounding, which may rewrite the fallback citation markers.
+        provisional = response._fallback
+        response = self._ground_opinion(response, criterion_id, evidences)
+
+        # Convert to JudicialOpinion
+        opinion = JudicialOpinion(
+            judge=self.judge_name,
+            criterion_id=criterion_id,
+            score=response.score,
+            argument=response.argument,
+            cited_evidence=response.cited_evidence,
+        )
+        opinion._provisional = provisional
+
+        if not opinion.cited_evidence or opinion.cited_evidence == [
+            "insufficient_verified_evidence"
+        ]:
+            opinion.score = min(opinion.score, 2)
+            opinion.argument += " No verified evidence; score capped."
+
+        logger.log_judicial_opinion(self.judge_name, criterion_id, opinion.score)
+
+        return opinion
+
+    def _error_opinion(self, criterion_id: str, error: Exception) -> JudicialOpinion:
+        """Build the neutral fallback opinion returned when evaluation fails."""
+        logger.error(
+            f"{self.judge_name} failed to render opinion: {error}", exc_info=True
+        )
+
+        opinion = JudicialOpinion(
+            judge=self.judge_name,
+            criterion_id=criterion_id,
+            score=3,  # Neutral score on error
+            argument=f"Failed to evaluate due to error: {str(error)}. Defaulting to neutral score.",
+            cited_evidence=["error"],
+        )
+        opinion._provisional = True
+        return opinion
 
     def _build_llm(self):
         """
         Build an LLM client based on configured provider credentials.
+
+        Provider packages are imported only in the branch that uses them, so a run
+        never pays the import cost of providers it does not select.
         """
         if (
             self.config.huggingface_api_key
@@ -238,6 +702,8 @@ Keep your argument concise (target 100-220 characters).
             and not self.config.anthropic_api_key
             and not self.config.groq_api_key
         ):
+            from langchain_openai import ChatOpenAI
+
             return ChatOpenAI(
                 model=self.config.default_llm_model,
                 temperature=self.config.llm_temperature,
@@ -247,6 +713,8 @@ Keep your argument concise (target 100-220 characters).
             )
 
         if self.config.openai_api_key:
+            from langchain_openai import ChatOpenAI
+
             return ChatOpenAI(
                 model=self.config.default_llm_model,
                 temperature=self.config.llm_temperature,
@@ -255,10 +723,12 @@ Keep your argument concise (target 100-220 characters).
             )
 
         if self.config.anthropic_api_key:
-            if ChatAnthropic is None:
+            try:
+                from langchain_anthropic import ChatAnthropic
+            except ImportError as exc:
                 raise ValueError(
                     "ANTHROPIC_API_KEY is set but langchain-anthropic is not installed"
-                )
+                ) from exc
             return ChatAnthropic(
                 model="claude-3-5-sonnet-latest",
                 temperature=self.config.llm_temperature,
@@ -266,10 +736,12 @@ Keep your argument concise (target 100-220 characters).
             )
 
         if self.config.groq_api_key:
-            if ChatGroq is None:
+            try:
+                from langchain_groq import ChatGroq
+            except ImportError as exc:
                 raise ValueError(
                     "GROQ_API_KEY is set but langchain-groq is not installed"
-                )
+                ) from exc
 
             model_name = self.config.default_llm_model
             if model_name.startswith(("gpt-", "claude-")):
@@ -287,6 +759,8 @@ Keep your argument concise (target 100-220 characters).
             )
 
         if self.config.huggingface_api_key:
+            from langchain_openai import ChatOpenAI
+
             model_name = self.config.default_huggingface_model
             return ChatOpenAI(
                 model=model_name,
@@ -318,17 +792,7 @@ Keep your argument concise (target 100-220 characters).
         Invoke structured output first; on tool/function-call failures, retry via JSON text mode.
         """
         if self.force_json_mode:
-            json_prompt = messages + [
-                {
-                    "role": "user",
-                    "content": (
-                        "Return ONLY valid JSON with keys: "
-                        "criterion_id (string), score (integer 1-5), "
-                        "argument (string min 100 chars), cited_evidence (array of strings). "
-                        f"Use criterion_id='{criterion_id}'."
-                    ),
-                }
-            ]
+            json_prompt = _json_prompt(messages, criterion_id)
             try:
                 response = self._invoke_with_rate_limit_retry(
                     lambda: self.llm.invoke(json_prompt),
@@ -344,24 +808,12 @@ Keep your argument concise (target 100-220 characters).
                     lambda: self.raw_llm.invoke(json_prompt),
                     operation="json_only_fallback_invoke",
                 )
-                return self._coerce_structured_response(
-                    fallback_response, criterion_id
-                )
+                return self._coerce_fallback(fallback_response, criterion_id)
             except Exception as exc:
-                if self._is_insufficient_quota(exc):
-                    logger.warning(
-                        f"{self.judge_name} provider quota depleted; returning neutral opinion."
-                    )
-                    return StructuredOpinion(
-                        criterion_id=criterion_id,
-                        score=3,
-                        argument=self._pad_argument(
-                            "Provider quota exhausted (HTTP 402 or insufficient credits). "
-                            "Returning neutral opinion to keep pipeline moving."
-                        ),
-                        cited_evidence=["provider_quota_depleted"],
-                    )
-                if self._is_tool_use_failure(exc):
+                error_kind = self._classify_exception(exc)
+                if error_kind == "quota":
+                    return self._quota_opinion(criterion_id)
+                if error_kind == "tool":
                     logger.warning(
                         f"{self.judge_name} structured function call failed in JSON-only mode; "
                         "retrying with raw JSON fallback."
@@ -370,9 +822,7 @@ Keep your argument concise (target 100-220 characters).
                         lambda: self.raw_llm.invoke(json_prompt),
                         operation="json_only_fallback_invoke",
                     )
-                    return self._coerce_structured_response(
-                        fallback_response, criterion_id
-                    )
+                    return self._coerce_fallback(fallback_response, criterion_id)
                 raise
 
         try:
@@ -380,95 +830,151 @@ Keep your argument concise (target 100-220 characters).
                 lambda: self.llm.invoke(messages),
                 operation="structured_invoke",
             )
+            if isinstance(response, StructuredOpinion):
+                return self._fast_validate(response, criterion_id)
             return self._coerce_structured_response(response, criterion_id)
         except (ValidationError, OutputParserException) as exc:
             logger.warning(
                 f"{self.judge_name} structured output validation failed; "
                 f"retrying with JSON fallback. Error: {exc}"
             )
+            json_prompt = _json_prompt(messages, criterion_id)
             fallback_response = self._invoke_with_rate_limit_retry(
-                lambda: self.raw_llm.invoke(
-                    messages
-                    + [
-                        {
-                            "role": "user",
-                            "content": (
-                                "Return ONLY valid JSON with keys: "
-                                "criterion_id (string), score (integer 1-5), "
-                                "argument (string min 100 chars), cited_evidence (array of strings). "
-                                f"Use criterion_id='{criterion_id}'."
-                            ),
-                        }
-                    ]
-                ),
+                lambda: self.raw_llm.invoke(json_prompt),
                 operation="json_fallback_invoke",
             )
-            return self._coerce_structured_response(fallback_response, criterion_id)
+            return self._coerce_fallback(fallback_response, criterion_id)
         except Exception as exc:
-            if self._is_insufficient_quota(exc):
+            error_kind = self._classify_exception(exc)
+            if error_kind == "quota":
+                return self._quota_opinion(criterion_id)
+            if error_kind == "tool":
                 logger.warning(
-                    f"{self.judge_name} provider quota depleted; returning neutral opinion."
+                    f"{self.judge_name} structured function call failed; retrying with JSON fallback."
                 )
-                return StructuredOpinion(
-                    criterion_id=criterion_id,
-                    score=3,
-                    argument=self._pad_argument(
-                        "Provider quota exhausted (HTTP 402 or insufficient credits). "
-                        "Returning neutral opinion to keep pipeline moving."
-                    ),
-                    cited_evidence=["provider_quota_depleted"],
+                fallback_response = self.raw_llm.invoke(
+                    _json_prompt(messages, criterion_id)
                 )
-            if self._is_tool_use_failure(exc):
+                return self._coerce_fallback(fallback_response, criterion_id)
+            raise
+
+    async def _ainvoke_with_fallback(
+        self, messages, criterion_id: str
+    ) -> StructuredOpinion:
+        """
+        Async twin of _invoke_with_fallback built on ainvoke.
+        """
+        if self.force_json_mode:
+            json_prompt = _json_prompt(messages, criterion_id)
+            try:
+                response = await self._ainvoke_with_rate_limit_retry(
+                    lambda: self.llm.ainvoke(json_prompt),
+                    operation="json_only_invoke",
+                )
+                return self._coerce_structured_response(response, criterion_id)
+            except (ValidationError, OutputParserException) as exc:
+                logger.warning(
+                    f"{self.judge_name} structured output validation failed in JSON-only mode; "
+                    f"retrying with raw JSON fallback. Error: {exc}"
+                )
+                fallback_response = await self._ainvoke_with_rate_limit_retry(
+                    lambda: self.raw_llm.ainvoke(json_prompt),
+                    operation="json_only_fallback_invoke",
+                )
+                return self._coerce_fallback(fallback_response, criterion_id)
+            except Exception as exc:
+                error_kind = self._classify_exception(exc)
+                if error_kind == "quota":
+                    return self._quota_opinion(criterion_id)
+                if error_kind == "tool":
+                    logger.warning(
+                        f"{self.judge_name} structured function call failed in JSON-only mode; "
+                        "retrying with raw JSON fallback."
+                    )
+                    fallback_response = await self._ainvoke_with_rate_limit_retry(
+                        lambda: self.raw_llm.ainvoke(json_prompt),
+                        operation="json_only_fallback_invoke",
+                    )
+                    return self._coerce_fallback(fallback_response, criterion_id)
+                raise
+
+        try:
+            response = await self._ainvoke_with_rate_limit_retry(
+                lambda: self.llm.ainvoke(messages),
+                operation="structured_invoke",
+            )
+            if isinstance(response, StructuredOpinion):
+                return self._fast_validate(response, criterion_id)
+            return self._coerce_structured_response(response, criterion_id)
+        except (ValidationError, OutputParserException) as exc:
+            logger.warning(
+                f"{self.judge_name} structured output validation failed; "
+                f"retrying with JSON fallback. Error: {exc}"
+            )
+            json_prompt = _json_prompt(messages, criterion_id)
+            fallback_response = await self._ainvoke_with_rate_limit_retry(
+                lambda: self.raw_llm.ainvoke(json_prompt),
+                operation="json_fallback_invoke",
+            )
+            return self._coerce_fallback(fallback_response, criterion_id)
+        except Exception as exc:
+            error_kind = self._classify_exception(exc)
+            if error_kind == "quota":
+                return self._quota_opinion(criterion_id)
+            if error_kind == "tool":
                 logger.warning(
                     f"{self.judge_name} structured function call failed; retrying with JSON fallback."
                 )
-                fallback_response = self.raw_llm.invoke(
-                    messages
-                    + [
-                        {
-                            "role": "user",
-                            "content": (
-                                "Return ONLY valid JSON with keys: "
-                                "criterion_id (string), score (integer 1-5), "
-                                "argument (string min 100 chars), cited_evidence (array of strings). "
-                                f"Use criterion_id='{criterion_id}'."
-                            ),
-                        }
-                    ]
+                fallback_response = await self.raw_llm.ainvoke(
+                    _json_prompt(messages, criterion_id)
                 )
-                return self._coerce_structured_response(fallback_response, criterion_id)
+                return self._coerce_fallback(fallback_response, criterion_id)
             raise
 
-    def _is_tool_use_failure(self, exc: Exception) -> bool:
-        message = str(exc)
-        markers = (
-            "tool_use_failed",
-            "Failed to call a function",
-            "function_calling",
+    def _coerce_fallback(self, response, criterion_id: str) -> StructuredOpinion:
+        """Coerce the response of a fallback retry and flag it as provisional."""
+        return _mark_fallback(self._coerce_structured_response(response, criterion_id))
+
+    def _quota_opinion(self, criterion_id: str) -> StructuredOpinion:
+        """Neutral placeholder returned when the provider quota is exhausted."""
+        logger.warning(
+            f"{self.judge_name} provider quota depleted; returning neutral opinion."
+        )
+        return _mark_fallback(
+            StructuredOpinion.model_construct(
+                criterion_id=criterion_id,
+                score=3,
+                argument=self._pad_argument(
+                    "Provider quota exhausted (HTTP 402 or insufficient credits). "
+                    "Returning neutral opinion to keep pipeline moving."
+                ),
+                cited_evidence=["provider_quota_depleted"],
+            )
         )
-        return any(marker in message for marker in markers)
 
-    def _is_rate_limit_error(self, exc: Exception) -> bool:
+    def _classify_exception(
+        self, exc: Exception
+    ) -> Literal["quota", "tool", "rate", "other"]:
+        """
+        Classify a provider failure, stringifying the exception only once.
+
+        Quota exhaustion wins over tool failures, which win over plain rate limits.
+        """
         message = str(exc)
-        markers = (
-            "429",
-            "rate_limit_exceeded",
-            "Rate limit reached",
-            "tokens per minute",
-            "insufficient_quota",
-        )
-        return any(marker in message for marker in markers)
+        if getattr(exc, "status_code", None) == 402 or _INSUFFICIENT_QUOTA_RE.search(
+            message.lower()
+        ):
+            return "quota"
+        if _TOOL_USE_FAILURE_RE.search(message):
+            return "tool"
+        if isinstance(exc, _rate_limit_error_types()) or _RATE_LIMIT_RE.search(message):
+            return "rate"
+        return "other"
 
-    def _is_insufficient_quota(self, exc: Exception) -> bool:
-        message = str(exc).lower()
-        markers = (
-            "insufficient_quota",
-            "quota",
-            "402",
-            "depleted your monthly included credits",
-            "payment required",
-        )
-        return any(marker in message for marker in markers)
+    def _is_rate_limit_error(self, exc: Exception) -> bool:
+        if isinstance(exc, _rate_limit_error_types()):
+            return True
+        return _RATE_LIMIT_RE.search(str(exc)) is not None
 
     def _invoke_with_rate_limit_retry(self, invoke_fn, operation: str):
         """
@@ -486,7 +992,7 @@ Keep your argument concise (target 100-220 characters).
                     raise
 
                 delay = min(max_delay, base_delay * (2**attempt))
-                jitter = random.uniform(0.0, min(0.5, delay * 0.25))
+                jitter = self._retry_rng.uniform(0.0, min(0.5, delay * 0.25))
                 wait_seconds = delay + jitter
                 logger.warning(
                     f"{self.judge_name} hit rate limit during {operation}; "
@@ -495,6 +1001,31 @@ Keep your argument concise (target 100-220 characters).
                 )
                 time.sleep(wait_seconds)
 
+    async def _ainvoke_with_rate_limit_retry(self, ainvoke_fn, operation: str):
+        """
+        Async twin of _invoke_with_rate_limit_retry that backs off with asyncio.sleep.
+        """
+        attempts = max(1, self.config.max_retries)
+        base_delay = self.config.llm_retry_base_delay_seconds
+        max_delay = self.config.llm_retry_max_delay_seconds
+
+        for attempt in range(attempts):
+            try:
+                return await ainvoke_fn()
+            except Exception as exc:
+                if not self._is_rate_limit_error(exc) or attempt == attempts - 1:
+                    raise
+
+                delay = min(max_delay, base_delay * (2**attempt))
+                jitter = self._retry_rng.uniform(0.0, min(0.5, delay * 0.25))
+                wait_seconds = delay + jitter
+                logger.warning(
+                    f"{self.judge_name} hit rate limit during {operation}; "
+                    f"retrying in {wait_seconds:.2f}s "
+                    f"(attempt {attempt + 1}/{attempts})."
+                )
+                await asyncio.sleep(wait_seconds)
+
     def _coerce_structured_response(
         self, response, criterion_id: str
     ) -> StructuredOpinion:
@@ -502,10 +1033,7 @@ Keep your argument concise (target 100-220 characters).
         expected_keys = {"criterion_id", "score", "argument", "cited_evidence"}
 
         if isinstance(response, StructuredOpinion):
-            if response.criterion_id:
-                return response
-            response.criterion_id = criterion_id
-            return response
+            return self._fast_validate(response, criterion_id)
 
         payload = None
         if isinstance(response, dict) and expected_keys.issubset(response.keys()):
@@ -530,8 +1058,6 @@ Keep your argument concise (target 100-220 characters).
                     "cited_evidence": ["fallback_evidence"],
                 }
 
-        payload.setdefault("criterion_id", criterion_id)
-
         # Coercions to handle providers that return strings or stringified lists
         if "score" in payload and isinstance(payload["score"], str):
             try:
@@ -544,7 +1070,7 @@ Keep your argument concise (target 100-220 characters).
             if isinstance(cited, str):
                 # Try to parse stringified list JSON, else wrap as single-item list
                 try:
-                    parsed = json.loads(cited)
+                    parsed = _json_loads(cited)
                     if isinstance(parsed, list):
                         payload["cited_evidence"] = parsed
                     else:
@@ -566,15 +1092,12 @@ Keep your argument concise (target 100-220 characters).
                         payload["cited_evidence"] = [cited]
 
         # Ensure all required keys exist before validation (but do not override provided values)
-        payload.setdefault("criterion_id", criterion_id)
-        if "score" not in payload:
-            payload["score"] = 3
-        if "argument" not in payload:
-            payload["argument"] = self._pad_argument(
-                "Fallback opinion with padding to satisfy minimum length."
-            )
-        if "cited_evidence" not in payload:
-            payload["cited_evidence"] = ["fallback_evidence"]
+        payload = {
+            **_DEFAULT_OPINION_FIELDS,
+            "criterion_id": criterion_id,
+            "cited_evidence": ["fallback_evidence"],
+            **payload,
+        }
 
         try:
             structured = StructuredOpinion(**payload)
@@ -587,14 +1110,30 @@ Keep your argument concise (target 100-220 characters).
                 "Model returned malformed opinion; defaulting to neutral score until a valid structured output is produced. "
                 "This padding ensures minimum length is satisfied for validation and indicates the provider output was unusable."
             )
-            structured = StructuredOpinion(
-                criterion_id=criterion_id,
-                score=3,
-                argument=self._pad_argument(padded_argument),
-                cited_evidence=["malformed_output"],
+            structured = _mark_fallback(
+                StructuredOpinion.model_construct(
+                    criterion_id=criterion_id,
+                    score=3,
+                    argument=self._pad_argument(padded_argument),
+                    cited_evidence=["malformed_output"],
+                )
             )
 
-        # Guard rails: keep score in range and enforce minimum argument length.
+        if "fallback_evidence" in structured.cited_evidence:
+            # Unparseable text or a payload without citations was wrapped.
+            _mark_fallback(structured)
+        return self._apply_guard_rails(structured)
+
+    def _fast_validate(
+        self, opinion: StructuredOpinion, criterion_id: str
+    ) -> StructuredOpinion:
+        """Finish an opinion the structured-output wrapper already parsed."""
+        if not opinion.criterion_id:
+            opinion.criterion_id = criterion_id
+        return self._apply_guard_rails(opinion)
+
+    def _apply_guard_rails(self, structured: StructuredOpinion) -> StructuredOpinion:
+        """Keep score in range, enforce minimum argument length and citations."""
         if not 1 <= structured.score <= 5:
             structured.score = 3
         if len(structured.argument or "") < 100:
@@ -613,11 +1152,7 @@ Keep your argument concise (target 100-220 characters).
         """Limit evidence to detectors relevant to the rubric target."""
         if not target_artifact:
             return evidences
-        allowed = {
-            "github_repo": {"RepoInvestigator"},
-            # Allow RepoInvestigator when evaluating docs so judges can cross-check PDF claims against code
-            "pdf_report": {"DocAnalyst", "VisionInspector", "CrossReference", "RepoInvestigator"},
-        }.get(target_artifact, set())
+        allowed = _ALLOWED_DETECTIVES_BY_ARTIFACT.get(target_artifact, frozenset())
         return {k: v for k, v in evidences.items() if k in allowed}
 
     def _extract_text_content(self, response) -> str:
@@ -640,26 +1175,60 @@ Keep your argument concise (target 100-220 characters).
         if not text:
             raise ValueError("Empty model response while parsing JSON payload")
 
-        candidate = text
-        if "```" in text:
-            match = re.search(r"```(?:json)?\s*(\{.*?\})\s*```", text, re.DOTALL)
-            if match:
-                candidate = match.group(1)
-        if candidate == text:
-            match = re.search(r"\{.*\}", text, re.DOTALL)
-            if match:
-                candidate = match.group(0)
+        if "{" not in text:
+            raise ValueError("Failed to parse JSON payload: no JSON object in response")
+
+        candidate = self._find_json_object(text) or text
 
         try:
-            return json.loads(candidate)
+            return _json_loads(candidate)
         except Exception as exc:
             raise ValueError(f"Failed to parse JSON payload: {exc}") from exc
 
+    def _find_json_object(self, text: str) -> Optional[str]:
+        """
+        Return the first balanced JSON object in text, preferring a fenced block.
+
+        Walks the text once tracking brace depth and string/escape state, so
+        braces inside string values do not end the object early.
+        """
+        start = 0
+        fence = text.find("```")
+        if fence != -1 and text.find("{", fence) != -1:
+            start = fence + 3
+
+        begin = text.find("{", start)
+        if begin == -1:
+            return None
+
+        depth = 0
+        in_string = False
+        escape = False
+        for index in range(begin, len(text)):
+            char = text[index]
+            if in_string:
+                if escape:
+                    escape = False
+                elif char == "\\":
+                    escape = True
+                elif char == '"':
+                    in_string = False
+            elif char == '"':
+                in_string = True
+            elif char == "{":
+                depth += 1
+            elif char == "}":
+                depth -= 1
+                if depth == 0:
+                    return text[begin : index + 1]
+        return None
+
     def _pad_argument(self, argument: str) -> str:
         """Ensure argument meets minimum length."""
-        if len(argument) >= 100:
+        shortfall = 100 - len(argument)
+        if shortfall <= 0:
             return argument
-        return argument + " " + (".".join(["pad"] * ((100 - len(argument)) // 4 + 1)))
+        return argument + " " + _PAD_SOURCE[:shortfall]
 
     # Override with token-budget-aware formatting for low-TPM providers.
     def _format_evidence_for_context(
@@ -667,43 +1236,50 @@ Keep your argument concise (target 100-220 characters).
         evidences: Dict[str, List[Evidence]],
         criterion: Dict,
     ) -> str:
-        target_artifact = criterion.get("target_artifact")
-        detective_targets = {
-            "RepoInvestigator": "github_repo",
-            "DocAnalyst": "pdf_report",
-            "VisionInspector": "pdf_report",
-            "CrossReference": "pdf_report",
-        }
-
-        context_parts = []
+        target_artifact = _criterion_field(criterion, "target_artifact", None)
+        context_parts: List[str] = []
         max_items = self.config.llm_max_evidence_items_per_detective
         max_content_chars = self.config.llm_max_evidence_content_chars
         max_context_chars = self.config.llm_max_context_chars
+        # Length of "\n".join(context_parts); starts at -1 for the missing leading separator.
+        context_len = -1
 
-        for detective_name, evidence_list in evidences.items():
-            if target_artifact and detective_name in detective_targets:
-                if detective_targets[detective_name] != target_artifact:
-                    continue
+        def emit(part: str) -> None:
+            nonlocal context_len
+            context_parts.append(part)
+            context_len += len(part) + 1
+            if context_len > max_context_chars:
+                raise _ContextBudgetExceeded
 
-            context_parts.append(f"\n## {detective_name} Evidence:\n")
+        try:
+            for detective_name, evidence_list in evidences.items():
+                if target_artifact and detective_name in _DETECTIVE_TARGETS:
+                    if _DETECTIVE_TARGETS[detective_name] != target_artifact:
+                        continue
 
-            selected_evidence = self._select_evidence_for_context(
-                evidence_list, max_items
-            )
+                emit(f"\n## {detective_name} Evidence:\n")
 
-            for evidence in selected_evidence:
-                status = "FOUND" if evidence.found else "NOT FOUND"
-                location = self._compact_location(evidence.location)
-                context_parts.append(f"\n{status} [{location}]")
-                context_parts.append(f"Confidence: {evidence.confidence:.2f}")
+                compact_locations: Dict[int, str] = {}
+                selected_evidence = self._select_evidence_for_context(
+                    evidence_list, max_items, compact_locations
+                )
 
-                if evidence.content:
-                    content = " ".join(evidence.content.split())
-                    if len(content) > max_content_chars:
-                        content = content[:max_content_chars] + "..."
-                    context_parts.append(f"Content: {content}")
+                for evidence in selected_evidence:
+                    status = "FOUND" if evidence.found else "NOT FOUND"
+                    location = compact_locations[id(evidence)]
+                    emit(f"\n{status} [{location}]")
+                    emit(f"Confidence: {evidence.confidence:.2f}")
 
-                context_parts.append("")
+                    if evidence.content:
+                        content = " ".join(evidence.content.split())
+                        if len(content) > max_content_chars:
+                            content = content[:max_content_chars] + "..."
+                        emit(f"Content: {content}")
+
+                    emit("")
+        except _ContextBudgetExceeded:
+            # Everything after this point would be cut by the truncation below.
+            pass
 
         context = "\n".join(context_parts)
         if len(context) > max_context_chars:
@@ -712,51 +1288,42 @@ Keep your argument concise (target 100-220 characters).
         return context
 
     def _select_evidence_for_context(
-        self, evidence_list: List[Evidence], max_items: int
+        self,
+        evidence_list: List[Evidence],
+        max_items: int,
+        compact_locations: Optional[Dict[int, str]] = None,
     ) -> List[Evidence]:
         """
         Prioritize diverse, high-signal evidence so critical proofs survive tight contexts.
+
+        When compact_locations is given, it is filled with each evidence's
+        compacted location keyed by id() so callers can reuse it.
         """
         if not evidence_list:
             return []
 
-        # De-duplicate near-identical evidence entries.
-        deduped: Dict[tuple[str, str], Evidence] = {}
+        # De-duplicate near-identical evidence entries, keeping each normalized
+        # location alongside its evidence so ranking does not recompute it.
+        deduped: Dict[tuple[str, str], tuple[Evidence, str]] = {}
         for ev in evidence_list:
-            key = (
-                self._normalize_location(self._compact_location(ev.location)),
-                (ev.content or "").strip()[:120].lower(),
-            )
+            compact = self._compact_location(ev.location)
+            if compact_locations is not None:
+                compact_locations[id(ev)] = compact
+            location = self._normalize_location(compact)
+            key = (location, (ev.content or "").strip()[:120].lower())
             current = deduped.get(key)
-            if current is None or ev.confidence > current.confidence:
-                deduped[key] = ev
-
-        priority_terms = (
-            "src/core/state.py",
-            "src/core/graph.py",
-            "src/tools/git_tools.py",
-            "src/agents/judges/base_judge.py",
-            "src/agents/judges/prosecutor.py",
-            "src/agents/judges/defense.py",
-            "src/agents/judges/tech_lead.py",
-            "pydantic models",
-            "parallel detective fan-out",
-            "distinct judge prompts",
-            "structuredopinion",
-            "response coercion",
-        )
+            if current is None or ev.confidence > current[0].confidence:
+                deduped[key] = (ev, location)
 
-        def rank(ev: Evidence) -> tuple[float, float]:
-            location = self._normalize_location(self._compact_location(ev.location))
+        def rank(entry: tuple[Evidence, str]) -> tuple[float, float]:
+            ev, location = entry
             content = (ev.content or "").lower()
-            bonus = 0.0
-            for term in priority_terms:
-                if term in location or term in content:
-                    bonus += 0.2
-            return ev.confidence + bonus, ev.confidence
+            matched = _find_priority_terms(location) | _find_priority_terms(content)
+            return ev.confidence + 0.2 * len(matched), ev.confidence
 
-        ranked = sorted(deduped.values(), key=rank, reverse=True)
-        return ranked[:max_items]
+        # nlargest keeps sorted()'s tie order but only holds max_items entries.
+        top = heapq.nlargest(max_items, deduped.values(), key=rank)
+        return [ev for ev, _ in top]
 
     def _compact_location(self, location: str) -> str:
         if not location:
@@ -778,36 +1345,26 @@ Keep your argument concise (target 100-220 characters).
         """
         Ground LLM output against known evidence to reduce path hallucinations.
         """
-        allowed_locations = self._collect_allowed_locations(evidences)
+        allowed_locations, evidence_tokens, evidence_signals = self._grounding_inputs(
+            evidences
+        )
         if not allowed_locations:
             response.criterion_id = criterion_id
             return response
 
-        argument = response.argument
         adjusted_score = response.score
-        unverified_paths = self._find_unverified_paths(argument, allowed_locations)
-        penalties = 0
-        if unverified_paths:
-            for path in unverified_paths:
-                argument = argument.replace(path, "[UNVERIFIED_PATH]")
-            penalties += 1
-
-        argument, removed_claims = self._prune_unverified_claim_sentences(
-            argument, evidences, allowed_locations
-        )
-        if removed_claims:
-            penalties += 1
-
-        argument, contradicted_claims = self._remove_contradicted_claim_sentences(
-            argument, evidences
-        )
-        if contradicted_claims:
-            adjusted_score = min(5, adjusted_score + 1)
-            argument += " Claims contradicting verified evidence were removed."
-
-        if penalties:
-            adjusted_score = max(1, adjusted_score - penalties)
-            argument += " Unverified claims were removed from this opinion."
+        if not response.argument.strip():
+            # Nothing to redact or prune; the pruners would only substitute the
+            # placeholder sentence, so skip straight to padding and citations.
+            argument = _NO_VERIFIED_CLAIMS_TEXT
+        else:
+            argument, adjusted_score = self._ground_argument(
+                response.argument,
+                adjusted_score,
+                allowed_locations,
+                evidence_tokens,
+                evidence_signals,
+            )
 
         if len(argument) < 100:
             argument = (
@@ -830,9 +1387,76 @@ Keep your argument concise (target 100-220 characters).
             cited_evidence=filtered_citations,
         )
 
+    def _ground_argument(
+        self,
+        argument: str,
+        adjusted_score: int,
+        allowed_locations: frozenset[str],
+        evidence_tokens: frozenset[str],
+        evidence_signals: frozenset[str],
+    ) -> tuple[str, int]:
+        """Redact and prune an argument, returning it with the adjusted score."""
+        argument, unverified_count = self._redact_unverified_paths(
+            argument, allowed_locations
+        )
+        penalties = 0
+        if unverified_count:
+            penalties += 1
+
+        # Split and normalize once; both pruners work on the same sentence lists.
+        # Sentences are normalized inline: they never repeat, so routing them
+        # through the _normalize_location cache would flush evidence locations.
+        sentences = _SENTENCE_SPLIT_RE.split(argument.strip())
+        normalized_sentences = [
+            sentence.strip().lower().replace("\\", "/") for sentence in sentences
+        ]
+        sentences, normalized_sentences, removed_claims = (
+            self._prune_unverified_claim_sentences(
+                sentences, normalized_sentences, allowed_locations, evidence_tokens
+            )
+        )
+        if removed_claims:
+            penalties += 1
+
+        argument, contradicted_claims = self._remove_contradicted_claim_sentences(
+            sentences, normalized_sentences, evidence_signals
+        )
+        if contradicted_claims:
+            adjusted_score = min(5, adjusted_score + 1)
+            argument += " Claims contradicting verified evidence were removed."
+
+        if penalties:
+            adjusted_score = max(1, adjusted_score - penalties)
+            argument += " Unverified claims were removed from this opinion."
+
+        return argument, adjusted_score
+
+    def _grounding_inputs(
+        self, evidences: Dict[str, List[Evidence]]
+    ) -> tuple[frozenset[str], frozenset[str], frozenset[str]]:
+        """
+        Return (allowed_locations, evidence_tokens, evidence_signals) for evidences.
+
+        Every criterion in one render_opinions batch grounds against the same
+        evidences dict, so these are derived once per batch and reused. Outside
+        a batch nothing is kept, so a dict mutated between calls is re-read.
+        """
+        cache = self._grounding_cache
+        cached = cache.get(id(evidences)) if cache is not None else None
+        if cached is None or cached[0] is not evidences:
+            cached = (
+                evidences,
+                self._collect_allowed_locations(evidences),
+                self._collect_evidence_tokens(evidences),
+                self._match_evidence_signals(self._build_evidence_text(evidences)),
+            )
+            if cache is not None:
+                cache[id(evidences)] = cached
+        return cached[1], cached[2], cached[3]
+
     def _collect_allowed_locations(
         self, evidences: Dict[str, List[Evidence]]
-    ) -> List[str]:
+    ) -> frozenset[str]:
         """Collect normalized evidence locations usable for citation checks."""
         locations: set[str] = set()
         for evidence_list in evidences.values():
@@ -845,14 +1469,14 @@ Keep your argument concise (target 100-220 characters).
                 )
                 if compact_location:
                     locations.add(compact_location)
-        return sorted(locations)
+        return frozenset(locations)
 
     def _normalize_location(self, value: str) -> str:
         """Normalize a location string for fuzzy evidence matching."""
-        return str(value or "").strip().lower().replace("\\", "/")
+        return _normalize_location(value)
 
     def _is_citation_verified(
-        self, citation: str, allowed_locations: List[str]
+        self, citation: str, allowed_locations: frozenset[str]
     ) -> bool:
         """Check whether a citation overlaps with known evidence locations."""
         normalized_citation = self._normalize_location(citation)
@@ -872,249 +1496,251 @@ Keep your argument concise (target 100-220 characters).
 
     def _fallback_citations(self, evidences: Dict[str, List[Evidence]]) -> List[str]:
         """Fallback to top evidence locations when model citations are ungrounded."""
-        ranked: List[Evidence] = []
-        for evidence_list in evidences.values():
-            ranked.extend(evidence_list)
-        ranked = sorted(ranked, key=lambda ev: ev.confidence, reverse=True)
-        fallback = [
-            self._compact_location(ev.location) for ev in ranked[:3] if ev.location
-        ]
+        top = heapq.nlargest(
+            3,
+            (ev for evidence_list in evidences.values() for ev in evidence_list),
+            key=lambda ev: ev.confidence,
+        )
+        fallback = [self._compact_location(ev.location) for ev in top if ev.location]
         return fallback or ["insufficient_verified_evidence"]
 
-    def _find_unverified_paths(
-        self, argument: str, allowed_locations: List[str]
-    ) -> List[str]:
-        """Extract path-like references that are not present in collected evidence."""
-        path_pattern = re.compile(
-            r"\b(?:src|lib|app|tools|agents)/[\w./-]+\b", re.IGNORECASE
-        )
-        unverified: List[str] = []
-        for match in path_pattern.finditer(argument):
-            referenced_path = match.group(0)
+    def _redact_unverified_paths(
+        self, argument: str, allowed_locations: frozenset[str]
+    ) -> tuple[str, int]:
+        """
+        Replace path-like references missing from collected evidence in one pass.
+
+        Returns the redacted argument and the number of references replaced.
+        """
+        unverified_count = 0
+
+        def redact(match) -> str:
+            nonlocal unverified_count
+            matched = match.group(0)
+            referenced_path = matched.rstrip("./-")
+            if len(referenced_path) <= matched.index("/"):
+                # Prefix followed only by separators: not a path reference.
+                return matched
+            trailing = matched[len(referenced_path) :]
             normalized_path = self._normalize_location(referenced_path)
-            is_verified = self._is_location_supported(normalized_path, allowed_locations)
-            if not is_verified:
-                unverified.append(referenced_path)
-        return unverified
+            if self._is_location_supported(normalized_path, allowed_locations):
+                return matched
+            unverified_count += 1
+            return "[UNVERIFIED_PATH]" + trailing
+
+        return _PATH_RE.sub(redact, argument), unverified_count
 
     def _is_location_supported(
-        self, normalized_path: str, allowed_locations: List[str]
+        self, normalized_path: str, allowed_locations: frozenset[str]
     ) -> bool:
         """
         Determine whether a referenced path is supported by known locations.
         Includes conservative aliases for legacy path mentions.
         """
-        for location in allowed_locations:
-            if (
-                normalized_path == location
-                or normalized_path in location
-                or location.endswith(normalized_path)
-            ):
-                return True
-
-        alias_map = {
-            "src/state.py": "src/core/state.py",
-            "src/graph.py": "src/core/graph.py",
-        }
-        alias = alias_map.get(normalized_path)
-        if alias:
-            for location in allowed_locations:
-                if alias == location or alias in location or location.endswith(alias):
-                    return True
+        # Exact hits are a hash lookup; an endswith match is also a substring
+        # match, so one containment scan covers the rest.
+        if normalized_path in allowed_locations:
+            return True
+        if any(normalized_path in location for location in allowed_locations):
+            return True
 
-        return False
+        return (
+            normalized_path in _LEGACY_PATH_ALIASES
+            and normalized_path in _supported_legacy_paths(allowed_locations)
+        )
 
     def _prune_unverified_claim_sentences(
         self,
-        argument: str,
-        evidences: Dict[str, List[Evidence]],
-        allowed_locations: List[str],
-    ) -> tuple[str, int]:
+        sentences: List[str],
+        normalized_sentences: List[str],
+        allowed_locations: frozenset[str],
+        evidence_tokens: frozenset[str],
+    ) -> tuple[List[str], List[str], int]:
         """
         Remove high-confidence quantitative/absolute claims not supported by evidence.
-        """
-        sentences = re.split(r"(?<=[.!?])\s+", argument.strip())
-        if not sentences:
-            return argument, 0
 
-        evidence_tokens = self._collect_evidence_tokens(evidences)
+        Takes split sentences with their _normalize_location forms and returns the
+        kept pairs, never empty, plus the number of sentences removed.
+        """
+        # Built on the first high-risk sentence, since most arguments have none.
+        # Without pyahocorasick the anchor check falls back to a substring scan.
+        location_automaton = None
+        automaton_built = False
         kept_sentences: List[str] = []
+        kept_normalized: List[str] = []
         removed_count = 0
+        # Boilerplate sentences repeat in long outputs; classify each distinct one once.
+        verdicts: Dict[str, bool] = {}
 
-        for sentence in sentences:
+        for sentence, normalized_sentence in zip(sentences, normalized_sentences):
             if not sentence:
                 continue
-            if self._is_high_risk_claim(
-                sentence
-            ) and not self._sentence_has_evidence_anchor(
-                sentence, evidence_tokens, allowed_locations
-            ):
+            is_unsupported = verdicts.get(normalized_sentence)
+            if is_unsupported is None:
+                is_unsupported = False
+                # Normalized form is lowercased, so it also feeds the
+                # case-sensitive high-risk patterns.
+                if self._is_high_risk_claim(normalized_sentence):
+                    if not automaton_built:
+                        location_automaton = self._build_location_automaton(
+                            allowed_locations
+                        )
+                        automaton_built = True
+                    is_unsupported = not self._sentence_has_evidence_anchor(
+                        normalized_sentence,
+                        evidence_tokens,
+                        allowed_locations,
+                        location_automaton,
+                    )
+                verdicts[normalized_sentence] = is_unsupported
+            if is_unsupported:
                 removed_count += 1
                 continue
             kept_sentences.append(sentence)
+            kept_normalized.append(normalized_sentence)
 
-        cleaned = " ".join(kept_sentences).strip()
-        if not cleaned:
-            cleaned = "Opinion retained only where verifiable evidence exists."
-        return cleaned, removed_count
+        if not kept_sentences:
+            kept_sentences = [_NO_VERIFIED_CLAIMS_TEXT]
+            kept_normalized = [_NO_VERIFIED_CLAIMS_TEXT.lower()]
+        return kept_sentences, kept_normalized, removed_count
 
     def _is_high_risk_claim(self, sentence: str) -> bool:
-        """Detect claim patterns that should be evidence-anchored."""
-        high_risk_patterns = (
-            r"\b\d{1,3}%\b",
-            r"\b\d+\s*(?:times|x)\b",
-            r"\b(?:always|never|purely|only|all|none|no evidence)\b",
-        )
-        return any(
-            re.search(pattern, sentence, re.IGNORECASE)
-            for pattern in high_risk_patterns
-        )
+        """
+        Detect claim patterns that should be evidence-anchored.
+
+        Expects lowercased text; callers normalize each sentence once and reuse it.
+        """
+        if not _HIGH_RISK_CANDIDATE_RE.search(sentence):
+            return False
+        return _HIGH_RISK_RE.search(sentence) is not None
 
     def _collect_evidence_tokens(
         self, evidences: Dict[str, List[Evidence]]
-    ) -> set[str]:
+    ) -> frozenset[str]:
         """Collect compact token set from evidence for lightweight claim anchoring."""
-        tokens: set[str] = set()
-        for evidence_list in evidences.values():
-            for evidence in evidence_list:
-                text = f"{evidence.location} {evidence.content or ''}"
-                for token in re.findall(r"[A-Za-z][A-Za-z0-9_./-]{3,}", text.lower()):
-                    if token.startswith(("src/", "http", "c:/")) or len(token) >= 6:
-                        tokens.add(token)
-        return tokens
+        # Newlines never occur inside a token, so one findall over the joined
+        # text yields the same tokens as scanning each evidence item separately.
+        joined = "\n".join(
+            f"{evidence.location} {evidence.content or ''}"
+            for evidence_list in evidences.values()
+            for evidence in evidence_list
+        ).lower()
+        return frozenset(
+            token
+            for token in _TOKEN_RE.findall(joined)
+            if token.startswith(("src/", "http", "c:/")) or len(token) >= 6
+        )
 
     def _sentence_has_evidence_anchor(
         self,
-        sentence: str,
-        evidence_tokens: set[str],
-        allowed_locations: List[str],
+        normalized_sentence: str,
+        evidence_tokens: frozenset[str],
+        allowed_locations: frozenset[str],
+        location_automaton=None,
     ) -> bool:
-        """Check whether a sentence overlaps with evidence-derived anchors."""
-        normalized_sentence = self._normalize_location(sentence)
-        if any(location in normalized_sentence for location in allowed_locations):
+        """
+        Check whether a sentence overlaps with evidence-derived anchors.
+
+        The sentence must already be passed through _normalize_location.
+        """
+        if location_automaton is not None:
+            if next(location_automaton.iter(normalized_sentence), None) is not None:
+                return True
+        elif any(location in normalized_sentence for location in allowed_locations):
             return True
 
-        sentence_tokens = set(
-            re.findall(r"[A-Za-z][A-Za-z0-9_./-]{3,}", normalized_sentence)
-        )
-        overlap = sentence_tokens & evidence_tokens
-        return len(overlap) >= 2
+        # Stop at the second distinct evidence token instead of collecting them all.
+        first_hit = None
+        for match in _TOKEN_RE.finditer(normalized_sentence):
+            token = match.group(0)
+            if token == first_hit:
+                continue
+            if token in evidence_tokens:
+                if first_hit is not None:
+                    return True
+                first_hit = token
+        return False
+
+    def _build_location_automaton(self, allowed_locations: frozenset[str]):
+        """
+        Build an Aho-Corasick automaton over evidence locations.
+
+        Returns None when pyahocorasick is unavailable or there are no locations.
+        """
+        if ahocorasick is None or not allowed_locations:
+            return None
+        automaton = ahocorasick.Automaton()
+        for location in allowed_locations:
+            automaton.add_word(location, location)
+        automaton.make_automaton()
+        return automaton
 
     def _remove_contradicted_claim_sentences(
-        self, argument: str, evidences: Dict[str, List[Evidence]]
+        self,
+        sentences: List[str],
+        normalized_sentences: List[str],
+        evidence_signals: frozenset[str],
     ) -> tuple[str, int]:
         """
         Remove claims that explicitly contradict strong, verified evidence.
-        """
-        sentences = re.split(r"(?<=[.!?])\s+", argument.strip())
-        if not sentences:
-            return argument, 0
-
-        evidence_text = self._build_evidence_text(evidences)
-        active_patterns: List[re.Pattern[str]] = []
-
-        if self._has_sandbox_evidence(evidence_text):
-            active_patterns.extend(
-                [
-                    re.compile(
-                        r"\bfail\w*\s+to\s+implement\s+sandbox(?:ed)?\s+git\b",
-                        re.IGNORECASE,
-                    ),
-                    re.compile(r"\bno mention of sandbox", re.IGNORECASE),
-                    re.compile(r"\blacks?\b.*\bsandbox", re.IGNORECASE),
-                    re.compile(r"\babsence of explicit sandbox", re.IGNORECASE),
-                    re.compile(r"\bno explicit sandbox", re.IGNORECASE),
-                    re.compile(
-                        r"\bwithout\b.*\bsandbox(?:ing|ed)?\b", re.IGNORECASE
-                    ),
-                ]
-            )
-
-        if self._has_parallel_graph_evidence(evidence_text):
-            active_patterns.extend(
-                [
-                    re.compile(r"\blinear graph\b", re.IGNORECASE),
-                    re.compile(r"\bno parallel\w*\b", re.IGNORECASE),
-                    re.compile(
-                        r"\bno code implements\b.*\b(parallel|fan-out|fan-in)\b",
-                        re.IGNORECASE,
-                    ),
-                    re.compile(
-                        r"\bno proof of\b.*\bparallel(?:ism| judges| execution)?\b",
-                        re.IGNORECASE,
-                    ),
-                    re.compile(
-                        r"\bparallel(?:ism| judges)?\b.*\bremains unverified\b",
-                        re.IGNORECASE,
-                    ),
-                ]
-            )
-
-        if self._has_distinct_persona_evidence(evidence_text):
-            active_patterns.extend(
-                [
-                    re.compile(
-                        r"\bshared\s+\d{1,3}%\s+identical prompt\b",
-                        re.IGNORECASE,
-                    ),
-                    re.compile(r"\bpersona collusion\b", re.IGNORECASE),
-                    re.compile(r"\black of distinct judicial logic\b", re.IGNORECASE),
-                ]
-            )
 
-        if not active_patterns:
-            return argument, 0
+        Takes split sentences with their _normalize_location forms and returns the
+        rejoined argument.
+        """
+        contradiction_re = _contradiction_re(
+            self._has_sandbox_evidence(evidence_signals),
+            self._has_parallel_graph_evidence(evidence_signals),
+            self._has_distinct_persona_evidence(evidence_signals),
+        )
+        if contradiction_re is None:
+            return " ".join(sentences), 0
 
         kept_sentences: List[str] = []
         removed_count = 0
-        for sentence in sentences:
-            normalized = self._normalize_location(sentence)
-            if any(pattern.search(normalized) for pattern in active_patterns):
+        for sentence, normalized in zip(sentences, normalized_sentences):
+            if contradiction_re.search(normalized):
                 removed_count += 1
                 continue
             kept_sentences.append(sentence)
 
         cleaned = " ".join(kept_sentences).strip()
         if not cleaned:
-            cleaned = "Opinion retained only where verifiable evidence exists."
+            cleaned = _NO_VERIFIED_CLAIMS_TEXT
         return cleaned, removed_count
 
     def _build_evidence_text(self, evidences: Dict[str, List[Evidence]]) -> str:
         """Flatten found evidence into one normalized text blob for rule checks."""
-        parts: List[str] = []
-        for evidence_list in evidences.values():
-            for evidence in evidence_list:
-                if not evidence.found:
-                    continue
-                parts.append(f"{evidence.location} {evidence.content or ''}")
-        return self._normalize_location(" ".join(parts))
+        blob = " ".join(
+            f"{evidence.location} {evidence.content or ''}"
+            for evidence_list in evidences.values()
+            for evidence in evidence_list
+            if evidence.found
+        )
+        # Normalized inline: the blob is unique per pass and would only evict
+        # real locations from the _normalize_location cache.
+        return blob.strip().lower().replace("\\", "/")
+
+    def _match_evidence_signals(self, evidence_text: str) -> frozenset[str]:
+        """Return the evidence signal terms present in evidence_text, in one scan."""
+        if _EVIDENCE_SIGNAL_AUTOMATON is not None:
+            return frozenset(
+                term for _, term in _EVIDENCE_SIGNAL_AUTOMATON.iter(evidence_text)
+            )
+        return frozenset(
+            term for term in _EVIDENCE_SIGNAL_TERMS if term in evidence_text
+        )
 
-    def _has_sandbox_evidence(self, evidence_text: str) -> bool:
+    def _has_sandbox_evidence(self, evidence_signals: frozenset[str]) -> bool:
         """Detect strong proof that sandboxed git behavior is implemented."""
-        required_terms = (
-            "sandboxed_git_clone",
-            "repositorysandbox.clone_repository",
-            "src/tools/git_tools.py",
-            "without raw os.system",
-        )
-        return any(term in evidence_text for term in required_terms)
+        return not _SANDBOX_SIGNAL_TERMS.isdisjoint(evidence_signals)
 
-    def _has_parallel_graph_evidence(self, evidence_text: str) -> bool:
+    def _has_parallel_graph_evidence(self, evidence_signals: frozenset[str]) -> bool:
         """Detect strong proof of non-linear graph orchestration."""
-        return (
-            "parallel detective fan-out" in evidence_text
-            or "parallel judge fan-out" in evidence_text
-            or "stategraph found with parallel architecture" in evidence_text
-            or "src/core/graph.py" in evidence_text
-        )
+        return not _PARALLEL_SIGNAL_TERMS.isdisjoint(evidence_signals)
 
-    def _has_distinct_persona_evidence(self, evidence_text: str) -> bool:
+    def _has_distinct_persona_evidence(self, evidence_signals: frozenset[str]) -> bool:
         """Detect proof that persona prompts are differentiated."""
         return (
-            "distinct judge prompts detected" in evidence_text
-            or (
-                "trust no one" in evidence_text
-                and "reward effort" in evidence_text
-                and "does it actually work" in evidence_text
-            )
+            "distinct judge prompts detected" in evidence_signals
+            or _PERSONA_PHRASE_TERMS <= evidence_signals
         )
@@ -75,14 +75,11 @@ from being crushed by perfectionism. Be generous, be encouraging, be fair."""
         """
         logger.info("Defense Attorney beginning evaluation of all criteria")
 
-        opinions = []
         dimensions = (
             rubric.dimensions if hasattr(rubric, "dimensions") else rubric["dimensions"]
         )
 
-        for dimension in dimensions:
-            opinion = self.render_opinion(dimension, evidences)
-            opinions.append(opinion)
+        opinions = self.render_opinions(dimensions, evidences)
 
         logger.info(f"Defense Attorney completed {len(opinions)} evaluations")
         return opinions
@@ -73,14 +73,11 @@ Be harsh, be specific, be right."""
         """
         logger.info("Prosecutor beginning evaluation of all criteria")
 
-        opinions = []
         dimensions = (
             rubric.dimensions if hasattr(rubric, "dimensions") else rubric["dimensions"]
         )
 
-        for dimension in dimensions:
-            opinion = self.render_opinion(dimension, evidences)
-            opinions.append(opinion)
+        opinions = self.render_opinions(dimensions, evidences)
 
         logger.info(f"Prosecutor completed {len(opinions)} evaluations")
         return opinions
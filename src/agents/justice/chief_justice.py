@@ -5,15 +5,77 @@ Resolves dialectical conflicts and renders final verdicts.
 
 import time
 from collections import defaultdict
-from typing import Dict, List, Tuple
+from typing import Any, Dict, List, Tuple
 
-from ...core.state import AgentState, JudicialOpinion
+from ...core.state import AgentState, JudicialOpinion, RubricConfig
 from ...utils.exceptions import NodeExecutionError
 from ...utils.formatters import MarkdownReportFormatter
 from ...utils.logger import get_logger
 
 logger = get_logger()
 
+# Synthesis note templates by kind. Notes are kept as (kind, params) and only
+# formatted when they are shown, since the summary surfaces just the first few.
+_NOTE_TEMPLATES = {
+    "no_opinions": "{criterion_id}: No opinions provided (defaulting to 3)",
+    "security_override": (
+        "{criterion_id}: Security flaw detected by Prosecutor. "
+        "Score capped at 3 per synthesis rules."
+    ),
+    "high_variance_capped": (
+        "{criterion_id}: High variance detected ({low}-{high}). "
+        "Prosecutor raised severe concerns (score: {prosecutor_score}); "
+        "applying conservative cap -> {final_score}."
+    ),
+    "high_variance": (
+        "{criterion_id}: High variance detected ({low}-{high}). "
+        "Balanced weighted synthesis (Prosecutor/TechLead 40%, Defense 20%) = "
+        "{final_score}."
+    ),
+    "moderate": (
+        "{criterion_id}: Moderate agreement. "
+        "Weighted synthesis (TechLead 50%, others 25% each) = {final_score}"
+    ),
+}
+_MISSING_EVIDENCE_NOTE = " Missing evidence for target artifact; capped at 3."
+
+SynthesisNote = Tuple[str, Dict[str, Any]]
+
+# Weighted scores for every (prosecutor, defense, tech_lead) triple on the 1-5
+# scale, rounded once at import instead of per criterion.
+_SCORE_RANGE = range(1, 6)
+_HIGH_VARIANCE_WEIGHTED = {
+    (p, d, t): int(round(p * 0.4 + d * 0.2 + t * 0.4))
+    for p in _SCORE_RANGE
+    for d in _SCORE_RANGE
+    for t in _SCORE_RANGE
+}
+_MODERATE_WEIGHTED = {
+    (p, d, t): int(round(p * 0.25 + d * 0.25 + t * 0.5))
+    for p in _SCORE_RANGE
+    for d in _SCORE_RANGE
+    for t in _SCORE_RANGE
+}
+
+# Synthesis summary header; only the assessment line varies per run.
+_SUMMARY_HEADER = """## Synthesis Summary
+
+The Chief Justice has reviewed all evidence and judicial opinions to render final verdicts.
+
+**Overall Assessment:** {total_score}/{max_score} ({percentage:.1f}%)
+
+### Synthesis Process
+
+The following principles guided the final verdicts:
+
+1. **Rule of Security:** Confirmed security flaws cap scores at 3
+2. **Rule of Evidence:** Forensic facts override subjective opinions
+3. **Rule of Functionality:** Tech Lead assessment carries highest weight for architecture
+
+### Key Resolutions
+
+"""
+
 
 class ChiefJustice:
     """
@@ -34,35 +96,35 @@ class ChiefJustice:
         opinions = state.get("opinions", [])
         evidences = state.get("evidences", {})
         rubric = state["rubric"]
-        dimensions = (
-            rubric.dimensions if hasattr(rubric, "dimensions") else rubric["dimensions"]
-        )
-        synthesis_rules = (
-            rubric.synthesis_rules
-            if hasattr(rubric, "synthesis_rules")
-            else rubric["synthesis_rules"]
-        )
+        # Resolve the rubric shape once; the model carries a cached index.
+        if isinstance(rubric, RubricConfig):
+            dimension_index = rubric.dimension_index
+            synthesis_rules = rubric.synthesis_rules
+        else:
+            dimension_index = [
+                (d["id"], d.get("target_artifact")) for d in rubric["dimensions"]
+            ]
+            synthesis_rules = rubric["synthesis_rules"]
 
-        logger.info(f"Synthesizing {len(opinions)} judicial opinions")
+        logger.info("Synthesizing %d judicial opinions", len(opinions))
 
         # Group opinions by criterion
         opinions_by_criterion = self._group_opinions(opinions)
 
+        # Evidence presence is invariant across criteria; check each artifact once
+        missing_by_artifact = {
+            artifact: self._is_target_missing(artifact, evidences)
+            for artifact in ("github_repo", "pdf_report")
+        }
+
         # Apply synthesis rules
         final_scores = {}
         synthesis_notes = []
 
-        for dimension in dimensions:
-            criterion = (
-                dimension.model_dump()
-                if hasattr(dimension, "model_dump")
-                else dimension
-            )
-            criterion_id = criterion["id"]
+        for criterion_id, target_artifact in dimension_index:
             criterion_opinions = opinions_by_criterion.get(criterion_id, [])
-            target_artifact = criterion.get("target_artifact")
-            missing_artifact = self._is_target_missing(target_artifact, evidences)
-            score, note = self._resolve_criterion(
+            missing_artifact = missing_by_artifact.get(target_artifact, False)
+            score, note = self._assess_criterion(
                 criterion_id, criterion_opinions, synthesis_rules, missing_artifact
             )
             final_scores[criterion_id] = score
@@ -86,7 +148,7 @@ class ChiefJustice:
             execution_time=execution_time,
         )
 
-        logger.info(f"Synthesis complete. Final scores: {final_scores}")
+        logger.info("Synthesis complete. Final scores: %s", final_scores)
 
         return {
             "final_scores": final_scores,
@@ -97,13 +159,18 @@ class ChiefJustice:
     def _group_opinions(
         self, opinions: List[JudicialOpinion]
     ) -> Dict[str, List[JudicialOpinion]]:
-        """Group opinions by criterion ID."""
+        """
+        Group opinions by criterion ID.
+
+        Returns the defaultdict itself (a dict subclass) rather than a copy;
+        callers read it with .get so missing criteria are never inserted.
+        """
         grouped: Dict[str, List[JudicialOpinion]] = defaultdict(list)
 
         for opinion in opinions:
             grouped[opinion.criterion_id].append(opinion)
 
-        return dict(grouped)
+        return grouped
 
     def _resolve_criterion(
         self,
@@ -123,129 +190,125 @@ class ChiefJustice:
         Returns:
             Tuple of (final_score, synthesis_note)
         """
-        if not opinions:
-            return 3, f"{criterion_id}: No opinions provided (defaulting to 3)"
-
-        # Extract scores from each judge
-        prosecutor_score = next(
-            (o.score for o in opinions if o.judge == "Prosecutor"), 3
+        final_score, note = self._assess_criterion(
+            criterion_id, opinions, synthesis_rules, missing_artifact
         )
-        defense_score = next((o.score for o in opinions if o.judge == "Defense"), 3)
-        tech_lead_score = next((o.score for o in opinions if o.judge == "TechLead"), 3)
+        return final_score, self._render_note(note)
+
+    def _assess_criterion(
+        self,
+        criterion_id: str,
+        opinions: List[JudicialOpinion],
+        synthesis_rules: Dict[str, str],
+        missing_artifact: bool = False,
+    ) -> Tuple[int, SynthesisNote]:
+        """
+        Resolve a criterion like _resolve_criterion, leaving the note unformatted.
+
+        Returns:
+            Tuple of (final_score, (note_kind, note_params))
+        """
+        if not opinions:
+            return 3, ("no_opinions", {"criterion_id": criterion_id})
+
+        # Index opinions by judge in one pass; reversed so the first opinion
+        # from each judge wins, as before.
+        by_judge = {o.judge: o for o in reversed(opinions)}
+        prosecutor_opinion = by_judge.get("Prosecutor")
+        defense_opinion = by_judge.get("Defense")
+        tech_lead_opinion = by_judge.get("TechLead")
+        prosecutor_score = prosecutor_opinion.score if prosecutor_opinion else 3
+        defense_score = defense_opinion.score if defense_opinion else 3
+        tech_lead_score = tech_lead_opinion.score if tech_lead_opinion else 3
 
         logger.debug(
-            f"{criterion_id} scores - Prosecutor: {prosecutor_score}, "
-            f"Defense: {defense_score}, TechLead: {tech_lead_score}"
+            "%s scores - Prosecutor: %s, Defense: %s, TechLead: %s",
+            criterion_id,
+            prosecutor_score,
+            defense_score,
+            tech_lead_score,
         )
 
         # Apply Rule of Security (from synthesis_rules)
-        if prosecutor_score == 1:
-            prosecutor_opinion = next(o for o in opinions if o.judge == "Prosecutor")
+        if prosecutor_opinion is not None and prosecutor_score == 1:
             if "security" in prosecutor_opinion.argument.lower():
-                logger.warning(f"Security override applied for {criterion_id}")
+                logger.warning("Security override applied for %s", criterion_id)
                 return (
                     min(prosecutor_score + 2, 3),
-                    f"{criterion_id}: Security flaw detected by Prosecutor. "
-                    f"Score capped at 3 per synthesis rules.",
+                    ("security_override", {"criterion_id": criterion_id}),
                 )
 
         # Calculate variance
-        scores = [prosecutor_score, defense_score, tech_lead_score]
+        scores = (prosecutor_score, defense_score, tech_lead_score)
         variance = max(scores) - min(scores)
 
-        # Missing artifact cap (e.g., vision disabled)
-        missing_cap = 5
-        if missing_artifact and synthesis_rules.get("missing_vision_cap"):
-            missing_cap = min(missing_cap, 4)
+        # Missing artifact caps (e.g., vision disabled), resolved to one upper
+        # bound; the rules are only consulted when the artifact is missing.
+        score_cap = 5
+        missing_evidence_cap = False
+        if missing_artifact:
+            if synthesis_rules.get("missing_vision_cap"):
+                score_cap = 4
+            # High variance plus missing evidence cap
+            if variance > 2 and synthesis_rules.get("high_variance_missing_evidence"):
+                score_cap = 3
+                missing_evidence_cap = True
 
         # Rule: High variance (>2) triggers re-evaluation logic
         if variance > 2:
             # Conservative synthesis under sharp disagreement to reduce false positives.
-            weighted_score = int(
-                round(
-                    (
-                        prosecutor_score * 0.4
-                        + defense_score * 0.2
-                        + tech_lead_score * 0.4
-                    )
-                )
-            )
+            weighted_score = _HIGH_VARIANCE_WEIGHTED[scores]
             if prosecutor_score <= 2:
                 final_score = min(weighted_score, 3)
-                note = (
-                    f"{criterion_id}: High variance detected ({min(scores)}-{max(scores)}). "
-                    f"Prosecutor raised severe concerns (score: {prosecutor_score}); "
-                    f"applying conservative cap -> {final_score}."
-                )
+                note_kind = "high_variance_capped"
             else:
                 final_score = weighted_score
-                note = (
-                    f"{criterion_id}: High variance detected ({min(scores)}-{max(scores)}). "
-                    f"Balanced weighted synthesis (Prosecutor/TechLead 40%, Defense 20%) = "
-                    f"{final_score}."
-                )
+                note_kind = "high_variance"
+            note_params = {
+                "criterion_id": criterion_id,
+                "low": min(scores),
+                "high": max(scores),
+                "prosecutor_score": prosecutor_score,
+                "final_score": final_score,
+            }
         else:
             # Moderate variance: weighted average with Tech Lead emphasis
-            final_score = int(
-                round(
-                    (
-                        prosecutor_score * 0.25
-                        + defense_score * 0.25
-                        + tech_lead_score * 0.5
-                    )
-                )
-            )
-            note = (
-                f"{criterion_id}: Moderate agreement. "
-                f"Weighted synthesis (TechLead 50%, others 25% each) = {final_score}"
-            )
+            final_score = _MODERATE_WEIGHTED[scores]
+            note_kind = "moderate"
+            note_params = {"criterion_id": criterion_id, "final_score": final_score}
 
         # Ensure score is in valid range
-        final_score = max(1, min(missing_cap, final_score))
+        final_score = max(1, min(score_cap, final_score))
+        if missing_evidence_cap:
+            note_params["missing_evidence_cap"] = True
 
-        # High variance plus missing evidence cap
-        if (
-            variance > 2
-            and synthesis_rules.get("high_variance_missing_evidence")
-            and missing_artifact
-        ):
-            final_score = min(final_score, 3)
-            note += " Missing evidence for target artifact; capped at 3."
+        return final_score, (note_kind, note_params)
 
-        return final_score, note
+    @staticmethod
+    def _render_note(note: SynthesisNote) -> str:
+        """Format a (kind, params) synthesis note into its display text."""
+        kind, params = note
+        text = _NOTE_TEMPLATES[kind].format(**params)
+        if params.get("missing_evidence_cap"):
+            text += _MISSING_EVIDENCE_NOTE
+        return text
 
     def _generate_summary(
-        self, synthesis_notes: List[str], final_scores: Dict[str, int]
+        self, synthesis_notes: List[SynthesisNote], final_scores: Dict[str, int]
     ) -> str:
         """Generate executive summary of the synthesis process."""
         total_score = sum(final_scores.values())
         max_score = len(final_scores) * 5
         percentage = (total_score / max_score * 100) if max_score > 0 else 0
 
-        summary = f"""
-## Synthesis Summary
-
-The Chief Justice has reviewed all evidence and judicial opinions to render final verdicts.
-
-**Overall Assessment:** {total_score}/{max_score} ({percentage:.1f}%)
-
-### Synthesis Process
-
-The following principles guided the final verdicts:
-
-1. **Rule of Security:** Confirmed security flaws cap scores at 3
-2. **Rule of Evidence:** Forensic facts override subjective opinions
-3. **Rule of Functionality:** Tech Lead assessment carries highest weight for architecture
-
-### Key Resolutions
-
-"""
-
-        # Add top 3 most notable resolutions
-        for note in synthesis_notes[:3]:
-            summary += f"- {note}\n"
-
-        return summary.strip()
+        # Add top 3 most notable resolutions; only these notes are ever formatted.
+        parts = [
+            _SUMMARY_HEADER.format(
+                total_score=total_score, max_score=max_score, percentage=percentage
+            )
+        ]
+        parts.extend(f"- {self._render_note(note)}\n" for note in synthesis_notes[:3])
+        return "".join(parts).strip()
 
     def _is_target_missing(self, target_artifact: str, evidences: Dict[str, list]) -> bool:
         """Check if any evidence exists for the target artifact."""
@@ -260,6 +323,10 @@ The following principles guided the final verdicts:
         return False
 
 
+# ChiefJustice keeps no per-run state, so every node invocation shares one.
+_CHIEF_JUSTICE = ChiefJustice()
+
+
 # Node function for LangGraph
 def chief_justice_node(state: AgentState) -> Dict:
     """
@@ -274,8 +341,12 @@ def chief_justice_node(state: AgentState) -> Dict:
     logger.log_node_start("ChiefJustice")
     start_time = time.time()
 
+    errors = state.get("errors")
+    if errors:
+        logger.warning("Errors detected upstream: %s", errors)
+
     try:
-        chief_justice = ChiefJustice()
+        chief_justice = _CHIEF_JUSTICE
         result = chief_justice.synthesize(state)
 
         duration = time.time() - start_time
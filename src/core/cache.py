@@ -0,0 +1,130 @@
+"""
+Content-addressed cache for LLM-backed node results.
+Lets repeated audits of unchanged evidence skip judge LLM round-trips.
+"""
+
+import functools
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from pydantic import BaseModel
+
+from ..utils.logger import get_logger
+
+logger = get_logger()
+
+# Settings that change what a judge would answer for the same evidence.
+_LLM_SETTING_FIELDS = (
+    "default_llm_model",
+    "default_groq_model",
+    "default_huggingface_model",
+    "huggingface_base_url",
+    "openai_base_url",
+    "llm_temperature",
+    "llm_max_output_tokens",
+    "llm_max_evidence_items_per_detective",
+    "llm_max_evidence_content_chars",
+    "llm_max_context_chars",
+)
+_PROVIDER_KEY_FIELDS = (
+    "openai_api_key",
+    "anthropic_api_key",
+    "groq_api_key",
+    "huggingface_api_key",
+)
+
+
+def _json_default(value: Any) -> Any:
+    """Serialize pydantic models (evidence, rubric) for canonical hashing."""
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    raise TypeError(f"Cannot serialize {type(value).__name__} for cache key")
+
+
+def llm_settings_fingerprint(config) -> Dict[str, Any]:
+    """
+    Return the config values that determine judge output.
+
+    Provider keys contribute only whether they are set, since they select the
+    provider; the secrets themselves never reach the cache key.
+    """
+    fingerprint = {field: getattr(config, field) for field in _LLM_SETTING_FIELDS}
+    fingerprint["providers"] = [
+        field for field in _PROVIDER_KEY_FIELDS if getattr(config, field)
+    ]
+    return fingerprint
+
+
+@functools.lru_cache(maxsize=1)
+def judge_logic_fingerprint() -> str:
+    """
+    Hash the judge modules' source so cache entries expire with the code.
+
+    Persona system prompts, the shared user prompt tail and the grounding rules
+    all live in the judges package; editing any of them changes what a judge
+    returns for the same evidence.
+    """
+    from ..agents import judges
+
+    digest = hashlib.blake2b(digest_size=16)
+    for module_path in sorted(Path(judges.__file__).parent.glob("*.py")):
+        digest.update(module_path.name.encode("utf-8"))
+        digest.update(module_path.read_bytes())
+    return digest.hexdigest()
+
+
+class NodeResultCache:
+    """
+    JSON-file cache of node state updates keyed by a hash of the node's inputs.
+    """
+
+    def __init__(self, cache_dir: str):
+        self.cache_dir = Path(cache_dir).expanduser()
+
+    def make_key(self, node_name: str, inputs: Dict[str, Any]) -> str:
+        """
+        Hash a node name and its inputs into a stable cache key.
+
+        Args:
+            node_name: Name of the graph node
+            inputs: The state slice and settings the node's output depends on
+
+        Returns:
+            Hex digest identifying the cached result
+        """
+        payload = json.dumps(
+            inputs, sort_keys=True, separators=(",", ":"), default=_json_default
+        )
+        digest = hashlib.blake2b(digest_size=20)
+        digest.update(node_name.encode("utf-8"))
+        digest.update(b"\0")
+        digest.update(payload.encode("utf-8"))
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached updates for key, or None on a miss or unreadable entry."""
+        try:
+            return json.loads(self._path(key).read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as exc:
+            logger.warning(f"Ignoring unreadable cache entry {key}: {exc}")
+            return None
+
+    def set(self, key: str, updates: Dict[str, Any]) -> None:
+        """Store JSON-serializable updates under key; failures are logged, not raised."""
+        path = self._path(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Write then rename so concurrent readers never see a partial entry.
+            tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+            tmp_path.write_text(json.dumps(updates), encoding="utf-8")
+            os.replace(tmp_path, path)
+        except OSError as exc:
+            logger.warning(f"Failed to write cache entry {key}: {exc}")
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.json"
@@ -3,21 +3,34 @@ Configuration management for the Automaton Auditor.
 Loads settings from environment variables with validation.
 """
 
+import functools
 import json
 import os
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, Callable, List, Optional, Tuple, Union
 
 from dotenv import load_dotenv
-from pydantic import Field
+from pydantic import Field, PrivateAttr
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 from ..utils.exceptions import ConfigurationError
 from ..utils.logger import get_logger
 
+_json_loads: Callable[[Union[str, bytes]], Any]
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # pragma: no cover - optional speedup dependency
+    _json_loads = json.loads
+
 logger = get_logger()
 
 
+@functools.lru_cache(maxsize=8)
+def _parse_allowed_domains(allowed_git_domains: str) -> Tuple[str, ...]:
+    """Split a comma-separated domain list; cached per distinct setting value."""
+    return tuple(d.strip() for d in allowed_git_domains.split(","))
+
+
 class Config(BaseSettings):
     """
     Application configuration loaded from environment variables.
@@ -54,6 +67,11 @@ class Config(BaseSettings):
     enable_vision_inspector: bool = Field(
         default=False, alias="ENABLE_VISION_INSPECTOR"
     )
+    # Opt-in reuse of judge opinions for identical evidence across runs
+    judge_cache_enabled: bool = Field(default=False, alias="AUDITOR_CACHE")
+    judge_cache_dir: str = Field(
+        default="~/.cache/automaton-auditor", alias="AUDITOR_CACHE_DIR"
+    )
 
     # Security Settings
     allowed_git_domains: str = Field(
@@ -86,6 +104,9 @@ class Config(BaseSettings):
         default=160, alias="LLM_MAX_EVIDENCE_CONTENT_CHARS"
     )
     llm_max_context_chars: int = Field(default=2400, alias="LLM_MAX_CONTEXT_CHARS")
+    # Per judge; the three judges run side by side, so up to 3x this many
+    # requests are in flight at once.
+    llm_max_concurrency: int = Field(default=2, alias="LLM_MAX_CONCURRENCY")
     llm_retry_base_delay_seconds: float = Field(
         default=1.0, alias="LLM_RETRY_BASE_DELAY_SECONDS"
     )
@@ -100,9 +121,12 @@ class Config(BaseSettings):
         case_sensitive=False,
     )
 
+    # Set once validate_configuration passes with LLM keys required.
+    _llm_keys_validated: bool = PrivateAttr(default=False)
+
     def get_allowed_domains(self) -> List[str]:
         """Parse allowed git domains from comma-separated string."""
-        return [d.strip() for d in self.allowed_git_domains.split(",")]
+        return list(_parse_allowed_domains(self.allowed_git_domains))
 
     @staticmethod
     def _normalize_api_key(value: Optional[str]) -> Optional[str]:
@@ -187,6 +211,9 @@ class Config(BaseSettings):
         if self.llm_max_context_chars <= 0:
             errors.append("LLM_MAX_CONTEXT_CHARS must be positive")
 
+        if self.llm_max_concurrency <= 0:
+            errors.append("LLM_MAX_CONCURRENCY must be positive")
+
         if self.llm_retry_base_delay_seconds <= 0:
             errors.append("LLM_RETRY_BASE_DELAY_SECONDS must be positive")
 
@@ -203,55 +230,46 @@ class Config(BaseSettings):
                 f"Configuration validation failed: {'; '.join(errors)}"
             )
 
+        if require_llm_keys:
+            self._llm_keys_validated = True
         logger.info("Configuration validated successfully")
 
     def setup_environment(self) -> None:
         """
         Set up environment variables for LangChain and other tools.
         """
-        # Set API keys
-        if self.openai_api_key:
-            os.environ["OPENAI_API_KEY"] = self.openai_api_key
-        else:
-            os.environ.pop("OPENAI_API_KEY", None)
-
-        if self.openrouter_api_key:
-            os.environ["OPENROUTER_API_KEY"] = self.openrouter_api_key
-        else:
-            os.environ.pop("OPENROUTER_API_KEY", None)
-
-        if self.openai_base_url:
-            os.environ["OPENAI_BASE_URL"] = self.openai_base_url
-        else:
-            os.environ.pop("OPENAI_BASE_URL", None)
-
-        if self.anthropic_api_key:
-            os.environ["ANTHROPIC_API_KEY"] = self.anthropic_api_key
-        else:
-            os.environ.pop("ANTHROPIC_API_KEY", None)
-
-        if self.groq_api_key:
-            os.environ["GROQ_API_KEY"] = self.groq_api_key
-        else:
-            os.environ.pop("GROQ_API_KEY", None)
-
-        if self.huggingface_api_key:
-            os.environ["HUGGINGFACE_API_KEY"] = self.huggingface_api_key
+        # Collect every variable first (None means unset), then apply only the
+        # ones that differ from the current environment.
+        env_updates = {
+            "OPENAI_API_KEY": self.openai_api_key,
+            "OPENROUTER_API_KEY": self.openrouter_api_key,
+            "OPENAI_BASE_URL": self.openai_base_url,
+            "ANTHROPIC_API_KEY": self.anthropic_api_key,
+            "GROQ_API_KEY": self.groq_api_key,
+            "HUGGINGFACE_API_KEY": self.huggingface_api_key,
             # Maintain compatibility with libraries expecting this variable name.
-            os.environ["HUGGINGFACEHUB_API_TOKEN"] = self.huggingface_api_key
-        else:
-            os.environ.pop("HUGGINGFACE_API_KEY", None)
-            os.environ.pop("HUGGINGFACEHUB_API_TOKEN", None)
-
-        # Set LangSmith
-        os.environ["LANGCHAIN_TRACING_V2"] = str(self.langchain_tracing_v2).lower()
-        os.environ["LANGCHAIN_ENDPOINT"] = self.langchain_endpoint
+            "HUGGINGFACEHUB_API_TOKEN": self.huggingface_api_key,
+            # Set LangSmith
+            "LANGCHAIN_TRACING_V2": str(self.langchain_tracing_v2).lower(),
+            "LANGCHAIN_ENDPOINT": self.langchain_endpoint,
+            "LANGCHAIN_PROJECT": self.langchain_project,
+        }
+        # An unset LangSmith key is left alone rather than cleared.
         if self.langchain_api_key:
-            os.environ["LANGCHAIN_API_KEY"] = self.langchain_api_key
-        os.environ["LANGCHAIN_PROJECT"] = self.langchain_project
+            env_updates["LANGCHAIN_API_KEY"] = self.langchain_api_key
+
+        for key, value in env_updates.items():
+            current = os.environ.get(key)
+            if value is None:
+                if current is not None:
+                    del os.environ[key]
+            elif current != value:
+                os.environ[key] = value
 
         # Create sandbox directory
-        Path(self.sandbox_dir).mkdir(parents=True, exist_ok=True)
+        sandbox_dir = Path(self.sandbox_dir)
+        if not sandbox_dir.is_dir():
+            sandbox_dir.mkdir(parents=True, exist_ok=True)
 
         logger.info("Environment configured")
 
@@ -299,8 +317,8 @@ def load_rubric(rubric_path: str = "rubric/week2_rubric.json") -> dict:
         if not rubric_file.exists():
             raise ConfigurationError(f"Rubric file not found: {rubric_path}")
 
-        with open(rubric_file, "r") as f:
-            rubric = json.load(f)
+        # Parse straight from bytes; orjson's decode error subclasses json's.
+        rubric = _json_loads(rubric_file.read_bytes())
 
         # Basic validation
         required_keys = ["rubric_metadata", "dimensions", "synthesis_rules"]
@@ -326,6 +344,6 @@ def get_config(require_llm_keys: bool = True) -> Config:
     global _config
     if _config is None:
         _config = load_config(require_llm_keys=require_llm_keys)
-    elif require_llm_keys:
+    elif require_llm_keys and not _config._llm_keys_validated:
         _config.validate_configuration(require_llm_keys=True)
     return _config
@@ -3,12 +3,15 @@ LangGraph orchestration for the Automaton Auditor.
 Implements the three-layer hierarchical state graph.
 """
 
+import functools
+import logging
 import time
 import os
 from pathlib import Path
-from typing import Dict
+from typing import Dict, Protocol
 
 from langgraph.graph import StateGraph, END
+from langgraph.graph.state import CompiledStateGraph
 
 from ..agents.detectives import (
     doc_analyst_node,
@@ -17,8 +20,13 @@ from ..agents.detectives import (
 )
 from ..agents.judges import defense_node, prosecutor_node, tech_lead_node
 from ..agents.justice import chief_justice_node
+from ..core.cache import (
+    NodeResultCache,
+    judge_logic_fingerprint,
+    llm_settings_fingerprint,
+)
 from ..core.config import get_config
-from ..core.state import AgentState, Evidence
+from ..core.state import AgentState, Evidence, JudicialOpinion
 from ..tools import PDFAnalyzer
 from ..utils.logger import get_logger
 
@@ -26,19 +34,18 @@ logger = get_logger()
 FAIL_FAST = os.getenv("AUDITOR_FAIL_FAST", "true").lower() == "true"
 
 
-def handle_error_node(state: AgentState) -> Dict:
+class NodeFunction(Protocol):
     """
-    Centralized error handler to ensure synthesis is aware of failures.
+    Callable[[AgentState], Dict] that keeps the `state` parameter name, which
+    LangGraph's add_node overloads match on.
     """
-    logger.log_node_start("HandleError")
-    errors = state.get("errors", [])
-    if errors:
-        logger.warning(f"Errors detected upstream: {errors}")
-    logger.log_node_complete("HandleError", 0.01)
-    return {"errors": errors}
+
+    def __call__(self, state: AgentState) -> Dict: ...
 
 
-def _safe_node(node_fn, node_name: str, empty_updates: Dict) -> callable:
+def _safe_node(
+    node_fn: NodeFunction, node_name: str, empty_updates: Dict
+) -> NodeFunction:
     """
     Wrap a node so failures are recorded in state instead of terminating the graph.
     """
@@ -50,14 +57,55 @@ def _safe_node(node_fn, node_name: str, empty_updates: Dict) -> callable:
             logger.log_node_error(node_name, exc)
             if FAIL_FAST:
                 raise
-            updates = dict(empty_updates)
-            updates["errors"] = [f"{node_name}: {exc}"]
-            return updates
+            return {**empty_updates, "errors": [f"{node_name}: {exc}"]}
+
+    return wrapper
+
+
+def _cached_judge_node(
+    node_fn: NodeFunction, node_name: str, cache: NodeResultCache
+) -> NodeFunction:
+    """
+    Wrap a judge node so opinions for identical evidence, rubric, LLM settings
+    and judge code are served from the result cache instead of new LLM calls.
+    """
+
+    def wrapper(state: AgentState) -> Dict:
+        config = get_config(require_llm_keys=False)
+        key = cache.make_key(
+            node_name,
+            {
+                "evidences": state.get("evidences", {}),
+                "rubric": state["rubric"],
+                "llm": llm_settings_fingerprint(config),
+                "judge_logic": judge_logic_fingerprint(),
+            },
+        )
+        cached = cache.get(key)
+        if cached is not None:
+            logger.info("%s: reusing cached opinions", node_name)
+            return {
+                "opinions": [
+                    JudicialOpinion.model_validate(opinion)
+                    for opinion in cached["opinions"]
+                ]
+            }
+
+        updates = node_fn(state)
+        opinions = updates.get("opinions", [])
+        # Neutral placeholders from errors or provider fallbacks must not
+        # outlive this run.
+        if not any(opinion.provisional for opinion in opinions):
+            cache.set(
+                key,
+                {"opinions": [opinion.model_dump(mode="json") for opinion in opinions]},
+            )
+        return updates
 
     return wrapper
 
 
-def create_auditor_graph() -> StateGraph:
+def create_auditor_graph() -> CompiledStateGraph:
     """
     Create the hierarchical auditor graph with parallel execution.
 
@@ -90,6 +138,27 @@ def create_auditor_graph() -> StateGraph:
     Returns:
         Compiled StateGraph
     """
+    config = get_config(require_llm_keys=False)
+    return _build_auditor_graph(
+        config.enable_vision_inspector,
+        config.judge_cache_enabled,
+        config.judge_cache_dir,
+    )
+
+
+@functools.lru_cache(maxsize=4)
+def _build_auditor_graph(
+    enable_vision_inspector: bool,
+    judge_cache_enabled: bool,
+    judge_cache_dir: str,
+) -> CompiledStateGraph:
+    """
+    Build and compile the graph for one configuration; cached per process.
+
+    The graph shape only depends on these settings, so repeated audits reuse
+    the compiled graph. FAIL_FAST is read when a node runs, so it needs no key.
+    Code that swaps module-level nodes must call _build_auditor_graph.cache_clear().
+    """
     logger.info("Building Automaton Auditor graph")
 
     # Create graph builder
@@ -99,7 +168,6 @@ def create_auditor_graph() -> StateGraph:
     builder.add_node("initialize", initialize_node)
 
     # Layer 1: Detective nodes (parallel)
-    config = get_config(require_llm_keys=False)
     builder.add_node(
         "repo_investigator",
         _safe_node(
@@ -117,7 +185,7 @@ def create_auditor_graph() -> StateGraph:
         ),
     )
     detective_nodes = ["repo_investigator", "doc_analyst"]
-    if config.enable_vision_inspector:
+    if enable_vision_inspector:
         builder.add_node(
             "vision_inspector",
             _safe_node(
@@ -142,17 +210,28 @@ def create_auditor_graph() -> StateGraph:
     )
 
     # Layer 2: Judge nodes (parallel)
+    judge_nodes = {
+        "Prosecutor": prosecutor_node,
+        "Defense": defense_node,
+        "TechLead": tech_lead_node,
+    }
+    if judge_cache_enabled:
+        judge_cache = NodeResultCache(judge_cache_dir)
+        judge_nodes = {
+            name: _cached_judge_node(node_fn, name, judge_cache)
+            for name, node_fn in judge_nodes.items()
+        }
+        logger.info("Judge result cache enabled at %s", judge_cache_dir)
     builder.add_node(
         "prosecutor",
-        _safe_node(prosecutor_node, "Prosecutor", {"opinions": []}),
+        _safe_node(judge_nodes["Prosecutor"], "Prosecutor", {"opinions": []}),
     )
-    builder.add_node("defense", _safe_node(defense_node, "Defense", {"opinions": []}))
     builder.add_node(
-        "tech_lead", _safe_node(tech_lead_node, "TechLead", {"opinions": []})
+        "defense", _safe_node(judge_nodes["Defense"], "Defense", {"opinions": []})
+    )
+    builder.add_node(
+        "tech_lead", _safe_node(judge_nodes["TechLead"], "TechLead", {"opinions": []})
     )
-
-    # Error handling node
-    builder.add_node("handle_error", handle_error_node)
 
     # Layer 3: Chief Justice synthesis
     builder.add_node(
@@ -187,11 +266,11 @@ def create_auditor_graph() -> StateGraph:
     builder.add_edge("aggregate_evidence", "defense")
     builder.add_edge("aggregate_evidence", "tech_lead")
 
-    # Fan-in: Judges to error handler then Chief Justice
-    builder.add_edge("prosecutor", "handle_error")
-    builder.add_edge("defense", "handle_error")
-    builder.add_edge("tech_lead", "handle_error")
-    builder.add_edge("handle_error", "chief_justice")
+    # Fan-in: Judges to Chief Justice; _safe_node has already recorded any
+    # judge failures in state["errors"].
+    builder.add_edge("prosecutor", "chief_justice")
+    builder.add_edge("defense", "chief_justice")
+    builder.add_edge("tech_lead", "chief_justice")
 
     # Chief Justice to Finalize
     builder.add_edge("chief_justice", "finalize")
@@ -218,15 +297,12 @@ def initialize_node(state: AgentState) -> Dict:
     """
     logger.log_node_start("Initialize")
 
-    logger.info(f"Initializing audit for repository: {state['repo_url']}")
-    logger.info(f"PDF report: {state['pdf_path']}")
+    logger.info("Initializing audit for repository: %s", state["repo_url"])
+    logger.info("PDF report: %s", state["pdf_path"])
 
-    return {
-        "execution_start_time": time.time(),
-        "evidences": {},
-        "opinions": [],
-        "errors": [],
-    }
+    # evidences, opinions and errors are reducer channels seeded by the caller's
+    # initial state; merging empty containers into them would be a no-op.
+    return {"execution_start_time": time.time()}
 
 
 def aggregate_evidence_node(state: AgentState) -> Dict:
@@ -243,22 +319,29 @@ def aggregate_evidence_node(state: AgentState) -> Dict:
 
     evidences = state.get("evidences", {})
 
+    # (total, found) per detective, computed in one pass over each list
+    stats = {
+        detective: (len(ev_list), sum(ev.found for ev in ev_list))
+        for detective, ev_list in evidences.items()
+    }
+
     # Log summary
-    total_evidence = sum(len(ev_list) for ev_list in evidences.values())
+    total_evidence = sum(total for total, _ in stats.values())
     logger.info(
-        f"Aggregated {total_evidence} pieces of evidence from {len(evidences)} detectives"
+        "Aggregated %d pieces of evidence from %d detectives",
+        total_evidence,
+        len(evidences),
     )
 
-    for detective, ev_list in evidences.items():
-        logger.info(f"  - {detective}: {len(ev_list)} evidence items")
+    if logger.isEnabledFor(logging.INFO):
+        for detective, (total, _) in stats.items():
+            logger.info("  - %s: %d evidence items", detective, total)
 
     # Create aggregated summary
-    summary_parts = []
-    for detective, ev_list in evidences.items():
-        found = sum(1 for ev in ev_list if ev.found)
-        summary_parts.append(f"{detective}: {found}/{len(ev_list)} found")
-
-    aggregated_summary = "; ".join(summary_parts)
+    aggregated_summary = "; ".join(
+        f"{detective}: {found}/{total} found"
+        for detective, (total, found) in stats.items()
+    )
 
     # Cross-reference PDF claims after fan-in so detective layer can stay parallel.
     cross_reference_evidence = _cross_reference_pdf_claims(state, evidences)
@@ -288,47 +371,126 @@ def _cross_reference_pdf_claims(
         if not pdf_file.exists():
             return []
 
-        base_dir = pdf_file.parent if pdf_file.parent.exists() else Path.cwd()
-        pdf_analyzer = PDFAnalyzer(base_dir)
+        # An existing file's parent always exists, so no cwd fallback is needed.
+        pdf_analyzer = PDFAnalyzer(pdf_file.parent)
         pdf_text = pdf_analyzer._extract_text(pdf_file)
+        if not pdf_text.strip():
+            return []
 
-        verified_locations = []
-        repo_roots: set[Path] = set()
+        verified_locations: set[str] = set()
+        root_candidates: set[str] = set()
         for evidence in repo_evidence:
-            if (
-                evidence.found
-                and evidence.location
-                and ("/" in evidence.location or "\\" in evidence.location)
-            ):
-                verified_locations.append(evidence.location)
-                normalized_location = str(evidence.location).replace("\\", "/")
+            location = evidence.location
+            if not (evidence.found and location):
+                continue
+            # One normalized copy serves both the separator test and the split.
+            normalized_location = location.replace("\\", "/")
+            if "/" in normalized_location:
+                verified_locations.add(location)
                 if "/repo/" in normalized_location:
-                    root_candidate = normalized_location.split("/repo/", 1)[0] + "/repo"
-                    root_path = Path(root_candidate)
-                    if root_path.exists() and root_path.is_dir():
-                        repo_roots.add(root_path)
-
-        # Build a verified file inventory from the cloned repository to avoid
-        # false hallucination flags when PDFs cite real files that were not
-        # directly emitted as detective evidence locations.
-        allowed_ext = {".py", ".md", ".json", ".toml", ".yaml", ".yml"}
-        for repo_root in repo_roots:
-            try:
-                for file_path in repo_root.rglob("*"):
-                    if file_path.is_file() and file_path.suffix.lower() in allowed_ext:
-                        verified_locations.append(str(file_path))
-            except Exception as exc:
-                logger.warning(
-                    f"Failed to enumerate repository files for cross-reference: {exc}"
-                )
-
-        cross_ref = pdf_analyzer.cross_reference_claims(pdf_text, verified_locations)
+                    root_candidates.add(
+                        normalized_location.split("/repo/", 1)[0] + "/repo"
+                    )
+        repo_roots = [
+            root_path
+            for root_path in map(Path, root_candidates)
+            if root_path.is_dir()
+        ]
+
+        # cross_reference_claims only consumes verified files once the text
+        # contains file claims, so the lazy inventory is never walked otherwise.
+        cross_ref = pdf_analyzer.cross_reference_claims(
+            pdf_text, _iter_verified_files(verified_locations, repo_roots)
+        )
         return list(cross_ref.values())
     except Exception as e:
-        logger.warning(f"Post-aggregation cross-reference failed: {e}")
+        logger.warning("Post-aggregation cross-reference failed: %s", e)
         return []
 
 
+def _iter_verified_files(verified_locations: set[str], repo_roots: list[Path]):
+    """
+    Yield evidence locations, then the cloned repositories' file inventories.
+
+    The inventory avoids false hallucination flags when PDFs cite real files
+    that were not directly emitted as detective evidence locations.
+    """
+    yield from verified_locations
+    for repo_root in repo_roots:
+        try:
+            inventory = _inventory_for_root(
+                str(repo_root), repo_root.stat().st_mtime_ns
+            )
+        except Exception as exc:
+            logger.warning(
+                "Failed to enumerate repository files for cross-reference: %s", exc
+            )
+            continue
+        yield from inventory
+
+
+# Upper bound on files collected per repository; keeps vendored monorepos from
+# dominating post-aggregation time and memory.
+_INVENTORY_MAX_FILES = 50_000
+_INVENTORY_EXTENSIONS = frozenset({".py", ".md", ".json", ".toml", ".yaml", ".yml"})
+# VCS, cache and dependency trees never hold files a report would cite.
+_INVENTORY_SKIP_DIRS = frozenset({".git", "node_modules", "__pycache__", ".venv", "venv"})
+
+
+@functools.lru_cache(maxsize=8)
+def _inventory_for_root(repo_root: str, mtime_ns: int) -> frozenset[str]:
+    """
+    Return the cached inventory of a cloned repository.
+
+    The root's mtime is part of the key so a re-clone into the same path is
+    rescanned; edits nested below the top level are not tracked, which is fine
+    for the read-only clones the detectives produce.
+    """
+    return frozenset(_list_inventory_files(Path(repo_root)))
+
+
+def _list_inventory_files(repo_root: Path) -> list[str]:
+    """
+    List citable files under repo_root with an explicit scandir walk.
+
+    Extensions are checked on the entry name before any stat, directory types
+    come from the cached DirEntry data, and skip directories are pruned. Unreadable
+    directories are skipped without discarding what was already collected. The
+    walk stops after _INVENTORY_MAX_FILES entries.
+    """
+    files: list[str] = []
+    stack = [str(repo_root)]
+    while stack:
+        directory = stack.pop()
+        try:
+            entries = os.scandir(directory)
+        except OSError as exc:
+            logger.debug("Skipping unreadable directory %s: %s", directory, exc)
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in _INVENTORY_SKIP_DIRS:
+                        stack.append(entry.path)
+                    continue
+                name = entry.name
+                dot = name.rfind(".")
+                if (
+                    dot > 0
+                    and name[dot:].lower() in _INVENTORY_EXTENSIONS
+                    and entry.is_file()
+                ):
+                    files.append(entry.path)
+                    if len(files) >= _INVENTORY_MAX_FILES:
+                        logger.warning(
+                            "Repository inventory for %s truncated at %d files",
+                            repo_root,
+                            _INVENTORY_MAX_FILES,
+                        )
+                        return files
+    return files
+
+
 def finalize_node(state: AgentState) -> Dict:
     """
     Finalize the audit and prepare outputs.
@@ -345,14 +507,14 @@ def finalize_node(state: AgentState) -> Dict:
     start_time = state.get("execution_start_time", end_time)
     total_duration = end_time - start_time
 
-    logger.info(f"Audit completed in {total_duration:.2f} seconds")
+    logger.info("Audit completed in %.2f seconds", total_duration)
 
     # Log final scores
     final_scores = state.get("final_scores", {})
-    if final_scores:
+    if final_scores and logger.isEnabledFor(logging.INFO):
         logger.info("Final Scores:")
         for criterion, score in final_scores.items():
-            logger.info(f"  - {criterion}: {score}/5")
+            logger.info("  - %s: %s/5", criterion, score)
 
     logger.log_node_complete("Finalize", 0.1)
 
@@ -4,9 +4,10 @@ Uses Pydantic for strict typing and operator reducers for parallel execution saf
 """
 
 import operator
-from typing import Annotated, Dict, List, Literal, Optional
+from functools import cached_property
+from typing import Annotated, Dict, List, Literal, Optional, Tuple
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
 from typing_extensions import TypedDict
 
 
@@ -59,6 +60,9 @@ class JudicialOpinion(BaseModel):
     timestamp: Optional[str] = Field(
         default=None, description="When opinion was rendered"
     )
+    # True for neutral placeholders from errors or provider fallbacks; never
+    # serialized, so cached opinions always load as final.
+    _provisional: bool = PrivateAttr(default=False)
 
     model_config = ConfigDict(
         json_schema_extra={
@@ -73,6 +77,11 @@ class JudicialOpinion(BaseModel):
         }
     )
 
+    @property
+    def provisional(self) -> bool:
+        """Whether this opinion is a placeholder that must not be cached."""
+        return self._provisional
+
 
 class RubricDimension(BaseModel):
     """Single criterion from the rubric."""
@@ -91,6 +100,29 @@ class RubricConfig(BaseModel):
     dimensions: List[RubricDimension]
     synthesis_rules: Dict[str, str]
 
+    @cached_property
+    def dimension_index(self) -> Tuple[Tuple[str, str], ...]:
+        """(id, target_artifact) pairs for each dimension, in rubric order."""
+        return tuple(
+            (dimension.id, dimension.target_artifact) for dimension in self.dimensions
+        )
+
+
+def _merge_evidences(
+    current: Dict[str, List[Evidence]], update: Dict[str, List[Evidence]]
+) -> Dict[str, List[Evidence]]:
+    """
+    Reducer for AgentState.evidences.
+
+    Lists from different nodes under the same key are concatenated instead of
+    the later update replacing the earlier one; neither input is mutated.
+    """
+    merged = dict(current)
+    for key, items in update.items():
+        existing = merged.get(key)
+        merged[key] = existing + items if existing else items
+    return merged
+
 
 class AgentState(TypedDict):
     """
@@ -98,7 +130,7 @@ class AgentState(TypedDict):
     Uses operator reducers to safely merge data from parallel nodes.
 
     Reducers:
-    - operator.ior: Merges dictionaries (union)
+    - _merge_evidences: Merges dictionaries, concatenating lists per key
     - operator.add: Appends to lists
     """
 
@@ -108,7 +140,7 @@ class AgentState(TypedDict):
     rubric: RubricConfig
 
     # Detective layer outputs (parallel execution safe)
-    evidences: Annotated[Dict[str, List[Evidence]], operator.ior]
+    evidences: Annotated[Dict[str, List[Evidence]], _merge_evidences]
 
     # Judge layer outputs (parallel execution safe)
     opinions: Annotated[List[JudicialOpinion], operator.add]
@@ -7,6 +7,7 @@ import sys
 import os
 import shutil
 import json
+from collections import deque
 from datetime import datetime
 from pathlib import Path
 import re
@@ -66,6 +67,41 @@ def _normalize_pdf_download_url(url: str) -> str:
     return url
 
 
+# Dependency and cache trees never hold a report; hidden directories are also skipped.
+_PDF_SEARCH_SKIP_DIRS = frozenset({"node_modules", "__pycache__", "venv"})
+
+
+def _find_files_by_name(name: str, root: Path, limit: int) -> list[Path]:
+    """
+    Breadth-first search under root for files named name, stopping at limit matches.
+
+    Uses one scandir pass per directory, prunes _PDF_SEARCH_SKIP_DIRS and hidden
+    directories, and does not descend into symlinked directories.
+    """
+    target = os.path.normcase(name)
+    matches: list[Path] = []
+    pending = deque([str(root)])
+    while pending:
+        try:
+            entries = os.scandir(pending.popleft())
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                entry_name = entry.name
+                if entry.is_dir(follow_symlinks=False):
+                    if (
+                        not entry_name.startswith(".")
+                        and entry_name not in _PDF_SEARCH_SKIP_DIRS
+                    ):
+                        pending.append(entry.path)
+                elif os.path.normcase(entry_name) == target and entry.is_file():
+                    matches.append(Path(entry.path).resolve())
+                    if len(matches) >= limit:
+                        return matches
+    return matches
+
+
 def _resolve_local_pdf_path(pdf_input: str) -> Path:
     """Resolve local PDF path from absolute, relative, or filename-only input."""
     candidate = Path(pdf_input).expanduser()
@@ -80,9 +116,7 @@ def _resolve_local_pdf_path(pdf_input: str) -> Path:
 
         # Filename-only fallback: search once inside repository tree.
         if candidate.parent == Path("."):
-            matches = [
-                p.resolve() for p in Path.cwd().rglob(candidate.name) if p.is_file()
-            ]
+            matches = _find_files_by_name(candidate.name, Path.cwd(), limit=3)
             if len(matches) == 1:
                 return matches[0]
             if len(matches) > 1:
@@ -195,6 +229,36 @@ def _resolve_source_mode(
     return "auto"
 
 
+def _link_latest_report(report_file: Path, latest_report_file: Path) -> None:
+    """
+    Point latest_report_file at report_file with a hard link.
+
+    Falls back to copying the report where hard links are unsupported.
+    """
+    latest_report_file.unlink(missing_ok=True)
+    try:
+        os.link(report_file, latest_report_file)
+    except OSError:
+        shutil.copyfile(report_file, latest_report_file)
+
+
+def _stream_audit(graph, initial_state: dict) -> dict:
+    """
+    Run the graph, reporting each node as it completes, and return the final state.
+
+    Equivalent to graph.invoke, but the CLI shows layer-by-layer progress
+    instead of staying silent until synthesis finishes.
+    """
+    result = initial_state
+    for mode, chunk in graph.stream(initial_state, stream_mode=["updates", "values"]):
+        if mode == "values":
+            result = chunk
+        else:
+            for node_name in chunk:
+                console.print(f"[dim]  completed {node_name}[/dim]")
+    return result
+
+
 def _run_audit(
     repo_url: str,
     pdf_path: str,
@@ -243,7 +307,7 @@ def _run_audit(
     graph = create_auditor_graph()
 
     console.print("\n[bold green]Starting audit execution...[/bold green]\n")
-    result = graph.invoke(initial_state)
+    result = _stream_audit(graph, initial_state)
 
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     report_file = output_path / f"audit_report_{timestamp}.md"
@@ -252,7 +316,7 @@ def _run_audit(
     report_content = result["final_report"]
     report_file.write_text(report_content, encoding="utf-8")
     # Keep a stable filename for quick access while preserving timestamped history.
-    latest_report_file.write_text(report_content, encoding="utf-8")
+    _link_latest_report(report_file, latest_report_file)
 
     console.print("\n[bold green]=== Audit Complete ===[/bold green]\n")
     console.print(f"[green]Saved report:[/green] {report_file}")
@@ -435,7 +499,7 @@ def triage_report(
 
         os.environ["AUDITOR_FAIL_FAST"] = "false"
         graph = create_auditor_graph()
-        result = graph.invoke(initial_state)
+        result = _stream_audit(graph, initial_state)
 
         exec_time = (
             result.get("execution_end_time", 0)
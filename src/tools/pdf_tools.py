@@ -3,9 +3,10 @@ PDF document analysis tools.
 Extracts text and images for forensic analysis.
 """
 
+import functools
 import warnings
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, List, Optional
 
 try:
     from pypdf import PdfReader
@@ -27,6 +28,30 @@ from ..utils.validators import SecurityValidator
 logger = get_logger()
 
 
+@functools.lru_cache(maxsize=32)
+def _extract_pdf_text(pdf_path: str, mtime_ns: int, size: int) -> str:
+    """
+    Extract text from every page of a PDF.
+
+    mtime_ns and size only take part in the cache key, so a modified file misses.
+    """
+    with open(pdf_path, "rb") as f:
+        reader = PdfReader(f)
+        text_parts: List[str] = []
+
+        for page_num, page in enumerate(reader.pages):
+            try:
+                page_text = page.extract_text()
+                text_parts.append(page_text)
+            except Exception as e:
+                logger.warning(f"Failed to extract text from page {page_num}: {e}")
+                continue
+
+        full_text = "\n".join(text_parts)
+        logger.info(f"Extracted {len(full_text)} characters from PDF")
+        return full_text
+
+
 class PDFAnalyzer:
     """
     Analyze PDF documents for evidence.
@@ -115,24 +140,11 @@ class PDFAnalyzer:
             PDFParsingError: If extraction fails
         """
         try:
-            with open(pdf_path, "rb") as f:
-                reader = PdfReader(f)
-                text_parts: List[str] = []
-
-                for page_num, page in enumerate(reader.pages):
-                    try:
-                        page_text = page.extract_text()
-                        text_parts.append(page_text)
-                    except Exception as e:
-                        logger.warning(
-                            f"Failed to extract text from page {page_num}: {e}"
-                        )
-                        continue
-
-                full_text = "\n".join(text_parts)
-                logger.info(f"Extracted {len(full_text)} characters from PDF")
-                return full_text
-
+            # Keyed on size and mtime so an edited file is parsed again; DocAnalyst
+            # and the post-aggregation cross-reference then share one parse.
+            resolved = Path(pdf_path).resolve()
+            stat = resolved.stat()
+            return _extract_pdf_text(str(resolved), stat.st_mtime_ns, stat.st_size)
         except Exception as e:
             raise PDFParsingError(f"Failed to extract text from PDF: {e}")
 
@@ -261,14 +273,14 @@ class PDFAnalyzer:
         }
 
     def cross_reference_claims(
-        self, text: str, verified_files: List[str]
+        self, text: str, verified_files: Iterable[str]
     ) -> Dict[str, Evidence]:
         """
         Cross-reference claims in PDF against actual files.
 
         Args:
             text: PDF text content
-            verified_files: List of files that actually exist
+            verified_files: Files that actually exist
 
         Returns:
             Evidence about claim accuracy
@@ -30,6 +30,10 @@ class SecurityFilter(logging.Filter):
 
     def filter(self, record: logging.LogRecord) -> bool:
         """Redact sensitive information from log messages."""
+        if record.args:
+            # Secrets can arrive through %-style args; redact the rendered text.
+            record.msg = record.getMessage()
+            record.args = None
         if hasattr(record, "msg") and isinstance(record.msg, str):
             # Always apply key-pattern redaction, then check keyword hints.
             redacted = self._redact_keys(record.msg)
@@ -113,31 +117,51 @@ class AuditorLogger:
     def clear_context(self) -> None:
         self._context.clear()
 
-    def _format_message(self, message: str) -> str:
+    def _format_message(self, message: str, has_args: bool = False) -> str:
         if self._context:
             context_str = " | ".join([f"{k}={v}" for k, v in self._context.items()])
+            if has_args:
+                # The message becomes a %-format template; keep context literal.
+                context_str = context_str.replace("%", "%%")
             return f"[{context_str}] {message}"
         return message
 
-    def debug(self, message: str, **kwargs: Any) -> None:
-        self.logger.debug(self._format_message(message), extra=kwargs)
+    # Positional args follow stdlib %-style formatting, which is deferred until
+    # a handler actually emits the record.
+    def debug(self, message: str, *args: Any, **kwargs: Any) -> None:
+        self.logger.debug(self._format_message(message, bool(args)), *args, extra=kwargs)
 
-    def info(self, message: str, **kwargs: Any) -> None:
-        self.logger.info(self._format_message(message), extra=kwargs)
+    def info(self, message: str, *args: Any, **kwargs: Any) -> None:
+        self.logger.info(self._format_message(message, bool(args)), *args, extra=kwargs)
 
-    def warning(self, message: str, **kwargs: Any) -> None:
-        self.logger.warning(self._format_message(message), extra=kwargs)
+    def warning(self, message: str, *args: Any, **kwargs: Any) -> None:
+        self.logger.warning(
+            self._format_message(message, bool(args)), *args, extra=kwargs
+        )
 
-    def error(self, message: str, exc_info: bool = False, **kwargs: Any) -> None:
+    def error(
+        self, message: str, *args: Any, exc_info: bool = False, **kwargs: Any
+    ) -> None:
         self.logger.error(
-            self._format_message(message), exc_info=exc_info, extra=kwargs
+            self._format_message(message, bool(args)),
+            *args,
+            exc_info=exc_info,
+            extra=kwargs,
         )
 
-    def critical(self, message: str, exc_info: bool = True, **kwargs: Any) -> None:
+    def critical(
+        self, message: str, *args: Any, exc_info: bool = True, **kwargs: Any
+    ) -> None:
         self.logger.critical(
-            self._format_message(message), exc_info=exc_info, extra=kwargs
+            self._format_message(message, bool(args)),
+            *args,
+            exc_info=exc_info,
+            extra=kwargs,
         )
 
+    def isEnabledFor(self, level: int) -> bool:
+        return self.logger.isEnabledFor(level)
+
     def log_node_start(self, node_name: str) -> None:
         self.info(f"[bold blue]Starting node:[/bold blue] {node_name}")
 
@@ -2,13 +2,16 @@
 Tests for agent implementations.
 """
 
+import threading
+import time
+
 import pytest
 from contextlib import nullcontext
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 
 from src.agents.detectives import RepoInvestigator, DocAnalyst
 from src.agents.judges import Prosecutor, Defense, TechLead
-from src.agents.judges.base_judge import StructuredOpinion
+from src.agents.judges.base_judge import StructuredOpinion, _normalize_location
 from src.agents.justice import ChiefJustice
 from src.core.state import Evidence, JudicialOpinion
 
@@ -148,6 +151,18 @@ class TestProsecutor:
         assert "Trust No One" in prompt
         assert "security" in prompt.lower()
 
+    def test_system_prompt_built_once_per_instance(self):
+        """Test the system prompt is cached after the first build."""
+        judge = Prosecutor()
+        with patch.object(
+            judge, "get_system_prompt", wraps=judge.get_system_prompt
+        ) as mock_prompt:
+            first = judge.system_prompt()
+            second = judge.system_prompt()
+
+        assert first is second
+        mock_prompt.assert_called_once()
+
     @pytest.mark.requires_api
     def test_evaluate_criteria_structure(self, sample_rubric):
         """Test evaluation returns correct structure."""
@@ -203,6 +218,45 @@ class TestProsecutor:
         assert opinion.criterion_id == "test_criterion"
         assert "fallback" in opinion.argument.lower()
 
+    def test_structured_success_skips_json_prompt(self, sample_rubric):
+        """The JSON fallback prompt should only be built when a fallback runs."""
+        judge = Prosecutor()
+        judge.force_json_mode = False
+        judge.llm = Mock()
+        judge.llm.invoke.return_value = StructuredOpinion(
+            criterion_id="test_criterion",
+            score=4,
+            argument=(
+                "Structured output argument that is long enough to satisfy the "
+                "minimum character requirement for structured opinions."
+            ),
+            cited_evidence=["offline_fallback"],
+        )
+
+        with patch("src.agents.judges.base_judge._json_prompt") as mock_prompt:
+            opinion = judge.render_opinion(sample_rubric["dimensions"][0], {})
+
+        assert opinion.score == 4
+        mock_prompt.assert_not_called()
+
+    def test_extract_json_payload_handles_fences_and_string_braces(self):
+        """JSON scanning should prefer fenced blocks and ignore braces in strings."""
+        judge = Prosecutor()
+        text = (
+            "Note {draft} below.\n```json\n"
+            '{"criterion_id": "c1", "argument": "uses {braces} and \\"quotes\\""}'
+            "\n```\nTrailing {noise}"
+        )
+
+        payload = judge._extract_json_payload(text)
+
+        assert payload == {
+            "criterion_id": "c1",
+            "argument": 'uses {braces} and "quotes"',
+        }
+        with pytest.raises(ValueError):
+            judge._extract_json_payload("no structured content here")
+
     def test_rate_limit_retry_then_success(self, sample_rubric):
         """Test retry behavior for transient rate-limit errors."""
         judge = Prosecutor()
@@ -229,6 +283,166 @@ class TestProsecutor:
         assert opinion.score == 4
         assert opinion.criterion_id == "test_criterion"
 
+    def test_rate_limit_detected_by_exception_type(self):
+        """Provider RateLimitError should be recognized without message markers."""
+        openai = pytest.importorskip("openai")
+        httpx = pytest.importorskip("httpx")
+        judge = Prosecutor()
+        response = httpx.Response(
+            429, request=httpx.Request("POST", "https://api.openai.com/v1/chat")
+        )
+        exc = openai.RateLimitError("slow down", response=response, body=None)
+
+        assert judge._is_rate_limit_error(exc)
+        assert not judge._is_rate_limit_error(Exception("connection reset"))
+
+    def test_classify_exception_precedence(self):
+        """Quota exhaustion outranks tool failures, which outrank rate limits."""
+        judge = Prosecutor()
+
+        assert judge._classify_exception(Exception("429 insufficient_quota")) == "quota"
+        assert judge._classify_exception(Exception("429 tool_use_failed")) == "tool"
+        assert judge._classify_exception(Exception("Rate limit reached")) == "rate"
+        assert judge._classify_exception(Exception("connection reset")) == "other"
+
+    @pytest.mark.asyncio
+    async def test_arender_opinion_retries_rate_limit_async(self, sample_rubric):
+        """Async path should back off with asyncio.sleep and then succeed."""
+        judge = Prosecutor()
+        criterion = sample_rubric["dimensions"][0]
+        judge.llm = Mock()
+        judge.llm.ainvoke = AsyncMock(
+            side_effect=[
+                Exception("429 rate_limit_exceeded"),
+                {
+                    "criterion_id": "test_criterion",
+                    "score": 4,
+                    "argument": (
+                        "This async retry result is intentionally long enough to satisfy "
+                        "the minimum argument length while verifying rate-limit recovery."
+                    ),
+                    "cited_evidence": ["retry_evidence"],
+                },
+            ]
+        )
+
+        with patch(
+            "src.agents.judges.base_judge.asyncio.sleep", new=AsyncMock()
+        ) as mock_sleep:
+            opinion = await judge.arender_opinion(criterion, {})
+
+        assert opinion.score == 4
+        assert opinion.criterion_id == "test_criterion"
+        mock_sleep.assert_awaited_once()
+
+    def test_render_opinions_preserves_criteria_order(self, sample_rubric):
+        """Threaded batch rendering should return opinions in criteria order."""
+        judge = Prosecutor()
+        first = dict(sample_rubric["dimensions"][0])
+        second = dict(first, id="second_criterion")
+
+        with patch.object(
+            judge,
+            "render_opinion",
+            side_effect=lambda criterion, evidences: criterion["id"],
+        ):
+            opinions = judge.render_opinions([first, second], {})
+
+        assert opinions == ["test_criterion", "second_criterion"]
+        assert judge.render_opinions([], {}) == []
+
+    def test_render_opinions_caps_concurrent_requests(
+        self, sample_rubric, monkeypatch
+    ):
+        """No more than LLM_MAX_CONCURRENCY criteria should be rendered at once."""
+        judge = Prosecutor()
+        monkeypatch.setattr(judge.config, "llm_max_concurrency", 2)
+        criteria = [
+            dict(sample_rubric["dimensions"][0], id=f"criterion_{index}")
+            for index in range(6)
+        ]
+        lock = threading.Lock()
+        in_flight = peak = 0
+
+        def fake_render(criterion, evidences):
+            nonlocal in_flight, peak
+            with lock:
+                in_flight += 1
+                peak = max(peak, in_flight)
+            time.sleep(0.02)
+            with lock:
+                in_flight -= 1
+            return criterion["id"]
+
+        with patch.object(judge, "render_opinion", side_effect=fake_render):
+            opinions = judge.render_opinions(criteria, {})
+
+        assert opinions == [criterion["id"] for criterion in criteria]
+        assert peak == 2
+
+    def test_render_opinions_isolates_failed_criterion(self, sample_rubric):
+        """One criterion failing should not affect the others in the batch."""
+        judge = Prosecutor()
+        first = dict(sample_rubric["dimensions"][0])
+        second = dict(first, id="second_criterion")
+        response = StructuredOpinion(
+            criterion_id="test_criterion",
+            score=4,
+            argument=(
+                "Batch evaluation argument that is long enough to satisfy the "
+                "minimum character requirement for structured opinions."
+            ),
+            cited_evidence=["offline_fallback"],
+        )
+
+        def fake_invoke(messages, criterion_id):
+            if criterion_id == "second_criterion":
+                raise RuntimeError("provider timeout")
+            return response
+
+        with patch.object(judge, "_invoke_with_fallback", side_effect=fake_invoke):
+            opinions = judge.render_opinions([first, second], {})
+
+        assert [op.criterion_id for op in opinions] == [
+            "test_criterion",
+            "second_criterion",
+        ]
+        assert opinions[0].score == 4
+        assert not opinions[0].provisional
+        assert opinions[1].cited_evidence == ["error"]
+        assert "provider timeout" in opinions[1].argument
+        assert opinions[1].provisional
+
+    @pytest.mark.asyncio
+    async def test_arender_opinions_preserves_criteria_order(self, sample_rubric):
+        """Batch helper should fan out and return opinions in criteria order."""
+        judge = Prosecutor()
+        first = dict(sample_rubric["dimensions"][0])
+        second = dict(first, id="second_criterion")
+
+        async def fake_ainvoke(messages):
+            criterion_id = "second_criterion" if "second_criterion" in str(
+                messages
+            ) else "test_criterion"
+            return StructuredOpinion(
+                criterion_id=criterion_id,
+                score=3,
+                argument=(
+                    "Concurrent evaluation argument that is long enough to satisfy the "
+                    "minimum character requirement for structured opinions."
+                ),
+                cited_evidence=["offline_fallback"],
+            )
+
+        judge.llm = Mock()
+        judge.llm.ainvoke = fake_ainvoke
+        opinions = await judge.arender_opinions([first, second], {})
+
+        assert [op.criterion_id for op in opinions] == [
+            "test_criterion",
+            "second_criterion",
+        ]
+
     def test_opinion_grounding_removes_unverified_paths(self, sample_rubric):
         """Test that hallucinated file-path claims are removed from opinions."""
         judge = Prosecutor()
@@ -266,6 +480,19 @@ class TestProsecutor:
         assert opinion.score == 3
         assert all("src/graphx.py" not in cite for cite in opinion.cited_evidence)
 
+    def test_redacts_unverified_paths_of_any_length(self):
+        """Long path references are redacted whole; trailing punctuation is kept."""
+        judge = Prosecutor()
+        long_path = "src/" + "a" * 300 + "/fake_module.py"
+
+        redacted, count = judge._redact_unverified_paths(
+            f"See {long_path}. Also src/core/graph.py.",
+            frozenset({"src/core/graph.py"}),
+        )
+
+        assert redacted == "See [UNVERIFIED_PATH]. Also src/core/graph.py."
+        assert count == 1
+
     def test_opinion_grounding_removes_unsupported_quant_claims(self, sample_rubric):
         """Unsupported percentage claims should be pruned and penalized."""
         judge = Prosecutor()
@@ -465,6 +692,163 @@ class TestProsecutor:
         assert "[UNVERIFIED_PATH]" not in opinion.argument
         assert any("src/core/state.py" in cite or "src/state.py" in cite for cite in opinion.cited_evidence)
 
+    def test_prepared_context_is_reused_across_judges(self, sample_rubric):
+        """A context built once should feed every judge without reformatting."""
+        criterion = sample_rubric["dimensions"][0]
+        prosecutor, defense = Prosecutor(), Defense()
+        _, evidence_context = prosecutor.prepare_context(criterion, {})
+
+        for judge in (prosecutor, defense):
+            with patch.object(judge, "_format_evidence_for_context") as mock_format:
+                _, messages = judge._build_messages(criterion, {}, evidence_context)
+            mock_format.assert_not_called()
+            assert evidence_context in messages[1]["content"]
+
+    def test_grounding_inputs_derived_once_per_batch(self, sample_rubric):
+        """A render_opinions batch should derive grounding inputs once, then drop them."""
+        judge = Prosecutor()
+        first = dict(sample_rubric["dimensions"][0])
+        second = dict(first, id="second_criterion")
+        evidences = {
+            "RepoInvestigator": [
+                Evidence(
+                    found=True,
+                    content="StateGraph wiring",
+                    location="src/core/graph.py",
+                    confidence=0.9,
+                    detective_name="RepoInvestigator",
+                )
+            ]
+        }
+        response = StructuredOpinion(
+            criterion_id="test_criterion",
+            score=4,
+            argument=(
+                "StateGraph wiring lives in src/core/graph.py. This argument is long "
+                "enough to satisfy the minimum length for structured opinions."
+            ),
+            cited_evidence=["src/core/graph.py"],
+        )
+
+        with patch.object(
+            judge, "_invoke_with_fallback", return_value=response
+        ), patch.object(
+            judge,
+            "_collect_allowed_locations",
+            wraps=judge._collect_allowed_locations,
+        ) as mock_collect:
+            judge.render_opinions([first, second], evidences)
+
+        assert mock_collect.call_count == 1
+        assert judge._grounding_cache is None
+
+    def test_grounding_inputs_reread_outside_batch(self):
+        """Direct calls should see in-place evidence changes and keep no reference."""
+        judge = Prosecutor()
+        evidences = {
+            "RepoInvestigator": [
+                Evidence(
+                    found=True,
+                    content="StateGraph wiring",
+                    location="src/core/graph.py",
+                    confidence=0.9,
+                    detective_name="RepoInvestigator",
+                )
+            ]
+        }
+
+        before = judge._grounding_inputs(evidences)
+        evidences["RepoInvestigator"].append(
+            Evidence(
+                found=True,
+                content="Pydantic models",
+                location="src/core/state.py",
+                confidence=0.9,
+                detective_name="RepoInvestigator",
+            )
+        )
+        after = judge._grounding_inputs(evidences)
+
+        assert "src/core/state.py" not in before[0]
+        assert "src/core/state.py" in after[0]
+        assert judge._grounding_cache is None
+
+    def test_select_evidence_prefers_priority_terms(self):
+        """Evidence naming priority files should outrank equally confident noise."""
+        judge = Prosecutor()
+        plain = Evidence(
+            found=True,
+            content="Generic helper module",
+            location="src/utils/helpers.py",
+            confidence=0.8,
+            detective_name="RepoInvestigator",
+        )
+        priority = Evidence(
+            found=True,
+            content="Pydantic models define the StructuredOpinion schema",
+            location="src/core/state.py",
+            confidence=0.7,
+            detective_name="RepoInvestigator",
+        )
+
+        selected = judge._select_evidence_for_context([plain, priority], 1)
+
+        assert selected == [priority]
+
+    def test_argument_sentences_bypass_location_cache(self):
+        """Grounding an argument should not fill the location cache with sentences."""
+        judge = Prosecutor()
+        _normalize_location.cache_clear()
+
+        judge._ground_argument(
+            "Pydantic models are present. There is 90% similarity across prompts.",
+            4,
+            frozenset({"src/core/state.py"}),
+            frozenset(),
+            frozenset(),
+        )
+
+        assert _normalize_location.cache_info().currsize == 0
+
+    def test_location_matcher_built_only_for_high_risk_sentences(self):
+        """The location matcher should be built lazily, at most once per argument."""
+        judge = Prosecutor()
+        locations = frozenset({"src/core/state.py"})
+        plain = ["Pydantic models are present.", "They are strongly typed."]
+        risky = [
+            "There is 90% similarity across all prompts.",
+            "Node wiring is always correct.",
+        ]
+
+        with patch.object(
+            judge,
+            "_build_location_automaton",
+            wraps=judge._build_location_automaton,
+        ) as mock_build:
+            judge._prune_unverified_claim_sentences(
+                plain, [sentence.lower() for sentence in plain], locations, frozenset()
+            )
+            assert mock_build.call_count == 0
+
+            _, _, removed = judge._prune_unverified_claim_sentences(
+                risky, [sentence.lower() for sentence in risky], locations, frozenset()
+            )
+
+        assert mock_build.call_count == 1
+        assert removed == 2
+
+    def test_location_automaton_anchors_like_substring_scan(self):
+        """The Aho-Corasick matcher should anchor exactly the sentences a scan does."""
+        pytest.importorskip("ahocorasick")
+        judge = Prosecutor()
+        locations = ["src/core/graph.py", "src/core/state.py"]
+        automaton = judge._build_location_automaton(locations)
+
+        for sentence in ("see src/core/state.py now", "see src/core/stat now"):
+            assert judge._sentence_has_evidence_anchor(
+                sentence, frozenset(), locations, location_automaton=automaton
+            ) == judge._sentence_has_evidence_anchor(sentence, frozenset(), locations)
+
 
 class TestDefense:
     """Tests for Defense judge."""
@@ -668,6 +1052,22 @@ class TestChiefJustice:
         assert score <= 3
         assert "security" in note.lower()
 
+    def test_generate_summary_formats_only_leading_notes(self):
+        """Test that deferred synthesis notes render only for the summary slots."""
+        chief = ChiefJustice()
+        notes = [
+            chief._assess_criterion(f"c{index}", [], {})[1] for index in range(5)
+        ]
+
+        with patch.object(
+            ChiefJustice, "_render_note", wraps=ChiefJustice._render_note
+        ) as render:
+            summary = chief._generate_summary(notes, {"c0": 3})
+
+        assert render.call_count == 3
+        assert "- c2: No opinions provided (defaulting to 3)" in summary
+        assert "c3:" not in summary
+
     def test_group_opinions(self):
         """Test grouping of opinions by criterion."""
         chief = ChiefJustice()
@@ -0,0 +1,108 @@
+"""
+Tests for the judge result cache.
+"""
+
+from unittest.mock import Mock
+
+from src.agents.judges import Prosecutor
+from src.core.cache import NodeResultCache
+from src.core.graph import _cached_judge_node
+from src.core.state import JudicialOpinion, RubricConfig
+
+
+class TestNodeResultCache:
+    """Tests for NodeResultCache class."""
+
+    def test_key_is_stable_and_input_sensitive(self, temp_dir, sample_evidence):
+        """Test that keys depend on node name and inputs, not dict order."""
+        cache = NodeResultCache(str(temp_dir))
+        inputs = {"evidences": {"RepoInvestigator": [sample_evidence]}, "n": 1}
+
+        key = cache.make_key("Prosecutor", inputs)
+
+        assert key == cache.make_key("Prosecutor", dict(reversed(inputs.items())))
+        assert key != cache.make_key("Defense", inputs)
+        assert key != cache.make_key("Prosecutor", {**inputs, "n": 2})
+
+    def test_get_set_roundtrip(self, temp_dir):
+        """Test storing and reading back an entry."""
+        cache = NodeResultCache(str(temp_dir))
+        key = cache.make_key("Prosecutor", {})
+
+        assert cache.get(key) is None
+        cache.set(key, {"opinions": []})
+        assert cache.get(key) == {"opinions": []}
+
+
+class TestCachedJudgeNode:
+    """Tests for the cached judge node wrapper."""
+
+    def test_second_run_reuses_opinions(
+        self, test_env, temp_dir, sample_opinion, sample_rubric, sample_evidence
+    ):
+        """Test that identical inputs skip the wrapped judge node."""
+        node_fn = Mock(return_value={"opinions": [sample_opinion]})
+        wrapper = _cached_judge_node(
+            node_fn, "Prosecutor", NodeResultCache(str(temp_dir))
+        )
+        state = {
+            "evidences": {"RepoInvestigator": [sample_evidence]},
+            "rubric": RubricConfig(**sample_rubric),
+        }
+
+        first = wrapper(state)
+        second = wrapper(state)
+
+        assert node_fn.call_count == 1
+        assert second["opinions"] == first["opinions"]
+        assert isinstance(second["opinions"][0], JudicialOpinion)
+
+    def test_quota_fallback_opinions_are_not_cached(
+        self, test_env, temp_dir, sample_rubric, sample_evidence
+    ):
+        """Test that a judge's quota-exhausted placeholders are not stored."""
+        judge = Prosecutor()
+        quota_error = Exception("Payment required: insufficient credits")
+        quota_error.status_code = 402
+        judge.llm = Mock()
+        judge.llm.invoke.side_effect = quota_error
+        judge.raw_llm = judge.llm
+        node_fn = Mock(
+            side_effect=lambda state: {
+                "opinions": judge.evaluate_all_criteria(
+                    state["rubric"], state["evidences"]
+                )
+            }
+        )
+        wrapper = _cached_judge_node(
+            node_fn, "Prosecutor", NodeResultCache(str(temp_dir))
+        )
+        state = {
+            "evidences": {"RepoInvestigator": [sample_evidence]},
+            "rubric": RubricConfig(**sample_rubric),
+        }
+
+        first = wrapper(state)
+        wrapper(state)
+
+        assert "Provider quota exhausted" in first["opinions"][0].argument
+        assert first["opinions"][0].provisional
+        assert node_fn.call_count == 2
+
+    def test_judge_logic_change_misses_cache(
+        self, test_env, temp_dir, monkeypatch, sample_opinion, sample_rubric
+    ):
+        """Test that editing judge prompts or grounding invalidates entries."""
+        node_fn = Mock(return_value={"opinions": [sample_opinion]})
+        wrapper = _cached_judge_node(
+            node_fn, "Prosecutor", NodeResultCache(str(temp_dir))
+        )
+        state = {"evidences": {}, "rubric": RubricConfig(**sample_rubric)}
+
+        wrapper(state)
+        monkeypatch.setattr(
+            "src.core.graph.judge_logic_fingerprint", lambda: "edited-prompts"
+        )
+        wrapper(state)
+
+        assert node_fn.call_count == 2
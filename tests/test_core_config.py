@@ -29,6 +29,7 @@ class TestConfig:
         assert config.llm_max_evidence_items_per_detective > 0
         assert config.llm_max_evidence_content_chars > 0
         assert config.llm_max_context_chars > 0
+        assert config.llm_max_concurrency > 0
         assert config.enable_vision_inspector is False
 
     def test_config_from_env(self, test_env):
@@ -294,3 +295,21 @@ class TestConfigurationIntegration:
         config2 = get_config()
 
         assert config1 is config2
+
+    def test_get_config_skips_revalidation_once_keys_validated(self, test_env, monkeypatch):
+        """Test that get_config validates LLM keys only until they pass once."""
+        import src.core.config
+        from src.core.config import get_config
+
+        src.core.config._config = None
+        config = get_config()
+        calls = []
+        monkeypatch.setattr(
+            Config,
+            "validate_configuration",
+            lambda self, require_llm_keys=True: calls.append(require_llm_keys),
+        )
+
+        assert get_config() is config
+        assert calls == []
+        src.core.config._config = None
@@ -173,6 +173,16 @@ class TestRubricConfig:
         assert len(rubric.dimensions) == 1
         assert rubric.dimensions[0].id == "test_criterion"
 
+    def test_dimension_index(self, sample_rubric):
+        """Test the cached (id, target_artifact) index over dimensions."""
+        rubric = RubricConfig(**sample_rubric)
+
+        assert rubric.dimension_index == (
+            ("test_criterion", rubric.dimensions[0].target_artifact),
+        )
+        assert rubric.dimension_index is rubric.dimension_index
+        assert "dimension_index" not in rubric.model_dump()
+
     def test_rubric_dimension_validation(self):
         """Test validation of rubric dimensions."""
         dimension = RubricDimension(
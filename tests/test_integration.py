@@ -2,10 +2,17 @@
 Integration tests for full system functionality.
 """
 
+import os
+
 import pytest
 from unittest.mock import patch, Mock
 
-from src.core.graph import create_auditor_graph, _cross_reference_pdf_claims
+from src.core.graph import (
+    create_auditor_graph,
+    _build_auditor_graph,
+    _cross_reference_pdf_claims,
+    _list_inventory_files,
+)
 from src.core.state import Evidence, JudicialOpinion
 
 
@@ -16,6 +23,14 @@ def _reset_graph_config(monkeypatch, enable_vision: bool) -> None:
     config_module._config = None
 
 
+@pytest.fixture(autouse=True)
+def fresh_graph():
+    """Compile each test's graph from the node functions patched in that test."""
+    _build_auditor_graph.cache_clear()
+    yield
+    _build_auditor_graph.cache_clear()
+
+
 class TestGraphIntegration:
     """Integration tests for the full LangGraph."""
 
@@ -45,6 +60,7 @@ class TestGraphIntegration:
         for node in expected_nodes:
             assert node in graph.nodes, f"Missing node: {node}"
         assert "vision_inspector" not in graph.nodes
+        assert "handle_error" not in graph.nodes
 
     def test_graph_nodes_with_optional_vision(self, monkeypatch):
         """Test graph topology when optional vision node is enabled."""
@@ -114,6 +130,73 @@ class TestGraphIntegration:
             for path in normalized_verified
         )
 
+    def test_cross_reference_skips_inventory_without_file_claims(self, temp_dir):
+        """The repo inventory is only walked when the PDF cites files."""
+        repo_file = temp_dir / "repo" / "src" / "main.py"
+        repo_file.parent.mkdir(parents=True)
+        repo_file.write_text("", encoding="utf-8")
+        pdf_file = temp_dir / "report.pdf"
+        pdf_file.write_text("placeholder", encoding="utf-8")
+        evidences = {
+            "RepoInvestigator": [
+                Evidence(
+                    found=True,
+                    location=str(repo_file),
+                    confidence=0.9,
+                    detective_name="RepoInvestigator",
+                )
+            ]
+        }
+
+        with (
+            patch(
+                "src.core.graph.PDFAnalyzer._extract_text",
+                lambda self, _path: "An architecture overview without file paths.",
+            ),
+            patch("src.core.graph._inventory_for_root") as inventory,
+        ):
+            result = _cross_reference_pdf_claims(
+                {"pdf_path": str(pdf_file)}, evidences
+            )
+
+        assert result == []
+        inventory.assert_not_called()
+
+    def test_repo_inventory_keeps_build_packages(self, temp_dir):
+        """Only VCS, cache and virtualenv directories are pruned."""
+        cited = temp_dir / "src" / "build" / "compiler.py"
+        cited.parent.mkdir(parents=True)
+        cited.write_text("", encoding="utf-8")
+        (temp_dir / ".git").mkdir()
+        (temp_dir / ".git" / "config.json").write_text("", encoding="utf-8")
+
+        assert _list_inventory_files(temp_dir) == [str(cited)]
+
+    def test_repo_inventory_skips_unreadable_directories(self, temp_dir, monkeypatch):
+        """One unreadable directory does not drop the rest of the inventory."""
+        readable = temp_dir / "src" / "main.py"
+        readable.parent.mkdir()
+        readable.write_text("", encoding="utf-8")
+        (temp_dir / "locked").mkdir()
+        real_scandir = os.scandir
+
+        def scandir(path):
+            if os.path.basename(path) == "locked":
+                raise PermissionError(13, "Permission denied", path)
+            return real_scandir(path)
+
+        monkeypatch.setattr("src.core.graph.os.scandir", scandir)
+
+        assert _list_inventory_files(temp_dir) == [str(readable)]
+
+    def test_repo_inventory_is_capped(self, temp_dir, monkeypatch):
+        """The inventory walk stops at the configured file cap."""
+        for index in range(5):
+            (temp_dir / f"module_{index}.py").write_text("", encoding="utf-8")
+        monkeypatch.setattr("src.core.graph._INVENTORY_MAX_FILES", 3)
+
+        assert len(_list_inventory_files(temp_dir)) == 3
+
     @pytest.mark.integration
     @pytest.mark.slow
     def test_full_execution_mocked(self, sample_agent_state, test_env, monkeypatch):
@@ -251,6 +334,16 @@ class TestEndToEndFlow:
         # This is tested implicitly by graph compilation
         assert graph is not None
 
+    def test_graph_reused_until_config_changes(self, monkeypatch):
+        """Test that the compiled graph is cached per configuration."""
+        _reset_graph_config(monkeypatch, enable_vision=False)
+        graph = create_auditor_graph()
+
+        assert create_auditor_graph() is graph
+
+        _reset_graph_config(monkeypatch, enable_vision=True)
+        assert create_auditor_graph() is not graph
+
 
 class TestErrorPropagation:
     """Test error handling throughout the system."""
@@ -289,7 +382,7 @@ class TestStateReduction:
 
     def test_evidence_reduction(self):
         """Test that evidences dict merges correctly."""
-        from operator import ior
+        from src.core.state import _merge_evidences
 
         state1 = {
             "Detective1": [
@@ -315,11 +408,16 @@ class TestStateReduction:
             ]
         }
 
-        merged = ior(state1, state2)
+        merged = _merge_evidences(state1, state2)
 
         assert "Detective1" in merged
         assert "Detective2" in merged
 
+        merged = _merge_evidences(merged, {"Detective1": state2["Detective2"]})
+
+        assert [ev.content for ev in merged["Detective1"]] == ["A", "B"]
+        assert len(state1["Detective1"]) == 1
+
     def test_opinion_reduction(self):
         """Test that opinions list appends correctly."""
         from operator import add
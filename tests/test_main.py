@@ -64,6 +64,28 @@ class TestPDFInputResolution:
 
         assert resolved == pdf_file.resolve()
 
+    def test_filename_search_skips_hidden_and_dependency_dirs(
+        self, temp_dir, monkeypatch
+    ):
+        for skipped in (".git", "node_modules"):
+            (temp_dir / skipped).mkdir()
+            (temp_dir / skipped / "report.pdf").write_bytes(b"%PDF-1.4\n%%EOF\n")
+        pdf_file = temp_dir / "docs" / "report.pdf"
+        pdf_file.parent.mkdir()
+        pdf_file.write_bytes(b"%PDF-1.4\n%%EOF\n")
+        monkeypatch.chdir(temp_dir)
+
+        assert main_module._resolve_local_pdf_path("report.pdf") == pdf_file.resolve()
+
+    def test_ambiguous_filename_is_rejected(self, temp_dir, monkeypatch):
+        for folder in ("a", "b"):
+            (temp_dir / folder).mkdir()
+            (temp_dir / folder / "report.pdf").write_bytes(b"%PDF-1.4\n%%EOF\n")
+        monkeypatch.chdir(temp_dir)
+
+        with pytest.raises(AutomatonAuditorException, match="ambiguous"):
+            main_module._resolve_local_pdf_path("report.pdf")
+
     def test_remote_mode_rejects_non_url(self, temp_dir):
         with pytest.raises(AutomatonAuditorException):
             main_module._resolve_pdf_input(
@@ -113,3 +135,61 @@ class TestPDFInputResolution:
                 output_dir=temp_dir,
                 source_mode="remote",
             )
+
+
+class TestStreamAudit:
+    """Tests for streamed graph execution."""
+
+    def test_stream_returns_final_state_and_reports_nodes(self):
+        from typing import TypedDict
+
+        from langgraph.graph import END, StateGraph
+
+        class _State(TypedDict):
+            count: int
+
+        builder = StateGraph(_State)
+        builder.add_node("first", lambda state: {"count": state["count"] + 1})
+        builder.add_node("second", lambda state: {"count": state["count"] * 10})
+        builder.set_entry_point("first")
+        builder.add_edge("first", "second")
+        builder.add_edge("second", END)
+        graph = builder.compile()
+
+        with main_module.console.capture() as capture:
+            result = main_module._stream_audit(graph, {"count": 1})
+
+        assert result == graph.invoke({"count": 1}) == {"count": 20}
+        assert "completed first" in capture.get()
+        assert "completed second" in capture.get()
+
+
+class TestLatestReport:
+    """Tests for the stable latest-report filename."""
+
+    def test_latest_report_replaced_on_each_run(self, temp_dir):
+        latest = temp_dir / "audit_report.md"
+        first = temp_dir / "audit_report_1.md"
+        second = temp_dir / "audit_report_2.md"
+        first.write_text("first", encoding="utf-8")
+        second.write_text("second", encoding="utf-8")
+
+        main_module._link_latest_report(first, latest)
+        assert latest.read_text(encoding="utf-8") == "first"
+
+        main_module._link_latest_report(second, latest)
+        assert latest.read_text(encoding="utf-8") == "second"
+        assert first.read_text(encoding="utf-8") == "first"
+
+    def test_falls_back_to_copy_without_hard_links(self, temp_dir, monkeypatch):
+        report = temp_dir / "audit_report_1.md"
+        latest = temp_dir / "audit_report.md"
+        report.write_text("report", encoding="utf-8")
+
+        def no_link(src, dst):
+            raise OSError("hard links not supported")
+
+        monkeypatch.setattr(main_module.os, "link", no_link)
+        main_module._link_latest_report(report, latest)
+
+        assert latest.read_text(encoding="utf-8") == "report"
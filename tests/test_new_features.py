@@ -71,7 +71,7 @@ def test_vision_model_config(monkeypatch):
         def invoke(self, messages):
             return type("DummyResp", (), {"content": "ok"})
 
-    monkeypatch.setattr("src.agents.detectives.vision_inspector.ChatOpenAI", DummyLLM)
+    monkeypatch.setattr("langchain_openai.ChatOpenAI", DummyLLM)
     summary = inspector._summarize_images([b"img"])
     assert "Detected 1 image" in summary
     assert captured["model"] == "test-vision-model"
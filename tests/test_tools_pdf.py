@@ -2,9 +2,12 @@
 Tests for PDF analysis tools.
 """
 
+import os
+from unittest.mock import MagicMock, patch
+
 import pytest
 
-from src.tools.pdf_tools import PDFAnalyzer
+from src.tools.pdf_tools import PDFAnalyzer, _extract_pdf_text
 from src.utils.exceptions import PDFParsingError
 
 
@@ -40,6 +43,26 @@ class TestPDFAnalyzer:
             # Parsing may fail for minimal PDFs
             pass
 
+    def test_extract_text_reuses_parse_until_file_changes(
+        self, analyzer, mock_pdf_file
+    ):
+        """Test that repeat extractions of an unchanged PDF are served from cache."""
+        _extract_pdf_text.cache_clear()
+        page = MagicMock()
+        page.extract_text.return_value = "page text"
+        with patch(
+            "src.tools.pdf_tools.PdfReader", return_value=MagicMock(pages=[page])
+        ) as reader:
+            assert analyzer._extract_text(mock_pdf_file) == "page text"
+            assert analyzer._extract_text(mock_pdf_file) == "page text"
+            assert reader.call_count == 1
+
+            stat = mock_pdf_file.stat()
+            os.utime(mock_pdf_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+            analyzer._extract_text(mock_pdf_file)
+            assert reader.call_count == 2
+        _extract_pdf_text.cache_clear()
+
     def test_analyze_content_concepts(self, analyzer, temp_dir):
         """Test concept detection in PDF content."""
         # Create a text-rich PDF simulation
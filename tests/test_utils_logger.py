@@ -97,6 +97,21 @@ class TestSecurityFilter:
         security_filter.filter(record)
         assert record.msg == original_msg
 
+    def test_filter_redacts_format_args(self, security_filter):
+        """Test that keys passed as %-style args are redacted after rendering."""
+        record = logging.LogRecord(
+            name="test",
+            level=logging.INFO,
+            pathname="",
+            lineno=0,
+            msg="Using key %s",
+            args=("sk-1234567890abcdefghijklmnop",),
+            exc_info=None,
+        )
+
+        security_filter.filter(record)
+        assert record.getMessage() == "Using key sk-***REDACTED***"
+
 
 class TestAuditorLogger:
     """Tests for AuditorLogger class."""
@@ -146,6 +161,29 @@ class TestAuditorLogger:
 
         logger.clear_context()
 
+    def test_lazy_format_args(self, caplog):
+        """Test %-style args with context values that contain a percent sign."""
+        logger = AuditorLogger()
+        logger.set_context(progress="50%")
+
+        with caplog.at_level(logging.INFO):
+            logger.info("Scored %s at %d", "criterion", 4)
+
+        assert "[progress=50%] Scored criterion at 4" in caplog.text
+
+        logger.clear_context()
+
+    def test_is_enabled_for(self):
+        """Test level checks delegate to the underlying logger."""
+        logger = AuditorLogger()
+        previous = logger.logger.level
+        logger.logger.setLevel(logging.WARNING)
+        try:
+            assert not logger.isEnabledFor(logging.INFO)
+            assert logger.isEnabledFor(logging.ERROR)
+        finally:
+            logger.logger.setLevel(previous)
+
     def test_log_node_start(self, caplog):
         """Test node start logging."""
         logger = AuditorLogger()